@@ -1,11 +1,40 @@
 import cmath
 
+import numpy as np
+
 def root2(a, b, c):
     disc = cmath.sqrt(b*b - 4*a*c)   
     x1 = (-b + disc) / (2*a)
     x2 = (-b - disc) / (2*a)
     return (x1, x2)
 
-print(root2(1, -5, 6))   
-print(root2(1, 4, 3))    
-print(root2(1, 1, 1))    
\ No newline at end of file
+def root2_batch(a, b, c):
+    # Solve a*x^2 + b*x + c = 0 for arrays of coefficients, row by row.
+    # Uses q = -(b + sign(b)*sqrt(disc)) / 2, x1 = q/a, x2 = c/q, which
+    # avoids the cancellation of -b + sqrt(disc) when b^2 >> 4ac.
+    # Returns (x1, x2) as float arrays when every discriminant is >= 0,
+    # complex arrays otherwise.  Rows with a == 0 are linear: x1 = -c/b and
+    # x2 = nan (both nan when b == 0 too).
+    a, b, c = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c)))
+    disc = b*b - 4*a*c
+    if np.all(disc >= 0):
+        # real fast path
+        q = -0.5 * (b + np.copysign(np.sqrt(disc), b))
+    else:
+        sq = np.sqrt(disc.astype(complex))
+        # pick the sign that makes b and the square root add up, not cancel
+        q = -0.5 * (b + np.where(b * sq.real >= 0, sq, -sq))
+    linear = (a == 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x1 = np.where(linear, np.where(b == 0, np.nan, -c / b), q / a)
+        x2 = np.where(linear, np.nan, c / q)
+    # q == 0 only when b == c == 0: a double root at 0
+    x2 = np.where((q == 0) & ~linear, 0, x2)
+    return (x1, x2)
+
+if __name__ == "__main__":
+    print(root2(1, -5, 6))   
+    print(root2(1, 4, 3))    
+    print(root2(1, 1, 1))    
+
+    print(root2_batch([1, 1, 1, 0], [-5, 1e8, 1, 2], [6, 1, 1, -4]))
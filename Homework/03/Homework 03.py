@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 def root3(a, b, c, d):
     if a == 0:
         return
@@ -12,14 +14,103 @@ def root3(a, b, c, d):
     q = (2*b1**3)/27 - (b1*c1)/3 + d1
 
     delta = (q/2)**2 + (p/3)**3
-    print(f"判別式 Δ = {delta:.4f}")
 
     if delta <= 0:
-        phi = math.acos(-q / (2 * math.sqrt(- (p**3)/27)))
+        if p == 0:
+            # p == 0 and delta <= 0 means q == 0: a triple root
+            return (-b1/3, -b1/3, -b1/3)
+        phi = math.acos(max(-1.0, min(1.0, -q / (2 * math.sqrt(- (p**3)/27)))))
         m = 2 * math.sqrt(-p/3)
         r1 = m*math.cos(phi/3) - b1/3
         r2 = m*math.cos((phi+2*math.pi)/3) - b1/3
         r3 = m*math.cos((phi+4*math.pi)/3) - b1/3
-        print("answer:", (r1, r2, r3))
+        return (r1, r2, r3)
+
+    # delta > 0: Cardano, one real root and a complex conjugate pair
+    w = -q/2 - math.copysign(math.sqrt(delta), q)
+    u = math.copysign(abs(w) ** (1/3), w)
+    v = -p / (3*u)
+    r1 = u + v - b1/3
+    r2 = complex(-(u + v)/2 - b1/3, math.sqrt(3)/2 * (u - v))
+    return (r1, r2, r2.conjugate())
+
+def root3_batch(a, b, c, d):
+    # Solve a*x^3 + b*x^2 + c*x + d = 0 for arrays of coefficients.
+    # Both the trigonometric (delta <= 0) and the Cardano (delta > 0)
+    # branch are computed for every row and selected with a mask.  Only
+    # one real root x1 is taken from them (polished by a Newton step); the
+    # other two come from the quadratic left after dividing out x1, so
+    # they stay accurate when |b/a| is large.
+    # Returns an array of shape (..., 3): float when every row has three
+    # real roots, complex otherwise.  Rows with a == 0 give nan.
+    a, b, c, d = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c, d)))
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        b1 = b / a
+        c1 = c / a
+        d1 = d / a
+        p = c1 - b1*b1 / 3
+        q = (2*b1**3)/27 - (b1*c1)/3 + d1
+        delta = (q/2)**2 + (p/3)**3
+        shift = -b1 / 3
+        trig = delta <= 0
+
+        # three real roots: start from the one of largest magnitude
+        m = 2 * np.sqrt(np.where(trig, -p/3, 0))
+        ratio = np.where(p < 0, -q / (2 * np.sqrt(np.abs(p**3) / 27)), 1)
+        phi = np.arccos(np.clip(ratio, -1, 1))
+        k = np.arange(3) * (2*np.pi)
+        real_roots = m[..., None] * np.cos((phi[..., None] + k) / 3) + shift[..., None]
+        largest = np.take_along_axis(real_roots, np.abs(real_roots).argmax(axis=-1)[..., None], -1)[..., 0]
+
+        # one real root and a complex pair: start from the real one (u, v chosen without cancellation)
+        w = -q/2 - np.copysign(np.sqrt(np.where(trig, 0, delta)), q)
+        u = np.cbrt(w)
+        v = np.where(u == 0, 0, -p / (3*u))
+        x1 = np.where(trig, largest, u + v + shift)
+
+        # one Newton step on the monic cubic, kept only if it reduces |f|
+        f = ((x1 + b1)*x1 + c1)*x1 + d1
+        step = f / ((3*x1 + 2*b1)*x1 + c1)
+        x_new = x1 - np.where(np.isfinite(step), step, 0)
+        f_new = ((x_new + b1)*x_new + c1)*x_new + d1
+        x1 = np.where(np.abs(f_new) < np.abs(f), x_new, x1)
+
+        # x^3 + b1 x^2 + c1 x + d1 = (x - x1)(x^2 - s x + t); divide x1 out
+        # backward when it is the largest root, forward when it is the smallest
+        backward = (np.abs(x1)**3 >= np.abs(d1)) & (x1 != 0)
+        safe = np.where(backward, x1, 1)
+        t = np.where(backward, -d1 / safe, 0)
+        s = np.where(backward, (c1 - t) / safe, -b1 - x1)
+        t = np.where(backward, t, c1 - x1*s)
+
+        # roots of x^2 - s x + t as in root2_batch; delta may have the wrong
+        # sign after cancellation, so the quadratic decides real or complex
+        disc = s*s - 4*t
+        real = (disc >= -4 * np.finfo(float).eps * (s*s + 4*np.abs(t))) | np.isnan(disc)
+        if np.all(real):
+            r = 0.5 * (s + np.copysign(np.sqrt(np.maximum(disc, 0)), s))
+            x2, x3 = r, np.where(r == 0, 0, t / np.where(r == 0, 1, r))
+            # same order as the trigonometric formula: largest, smallest, middle
+            roots = np.sort(np.stack([x1, x2, x3], axis=-1), axis=-1)[..., [2, 0, 1]]
+            return np.where(np.isnan(delta)[..., None], np.nan, roots)
+        sq = np.sqrt(np.where(real, np.maximum(disc, 0), disc).astype(complex))
+        r = 0.5 * (s + np.where(s * sq.real >= 0, sq, -sq))
+        x2, x3 = r, np.where(r == 0, 0, t / np.where(r == 0, 1, r))
+        ordered = np.sort(np.stack([x1, x2.real, x3.real], axis=-1), axis=-1)[..., [2, 0, 1]]
+        # complex pairs as (x1, re + i|im|, re - i|im|)
+        upper = x2.imag >= x3.imag
+        paired = np.stack([x1 + 0j, np.where(upper, x2, x3), np.where(upper, x3, x2)], axis=-1)
+    roots = np.where(real[..., None], ordered, paired)
+    return np.where(np.isnan(delta)[..., None], np.nan, roots)
+
+if __name__ == "__main__":
+    print("answer:", root3(1, -6, 11, -6))
+    print("answer:", root3(1, 0, 0, -1))
+    print(root3_batch([1, 1, 1, 0], [-6, 0, -3, 1], [11, 0, 3, 1], [-6, -1, -1, 1]))
 
-root3(1, -6, 11, -6)   
+    # large |b/a|: the two small roots must keep their relative accuracy
+    for b in (1e4, 1e6, 1e8):
+        got = root3_batch(1, b, 1, 1)
+        for z in np.roots([1, b, 1, 1]):
+            assert np.min(np.abs(got - z)) <= 1e-10 * abs(z), (b, got)
+    print("root3_batch matches np.roots for b/a up to 1e8")
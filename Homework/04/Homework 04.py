@@ -1,6 +1,20 @@
+import argparse
+import importlib.util
+import itertools
+import os
+import sys
+import time
+from collections import namedtuple
+
 import numpy as np
 
-def root(c):
+def root(c, method='eig', **options):
+    # method 'eig' uses the companion matrix (O(n^3), fine up to a few
+    # thousand degrees); 'aberth' runs aberth(c, **options) instead, which
+    # never builds an n x n matrix.
+    if method not in ('eig', 'aberth'):
+        raise ValueError(f"unknown root finding method: {method}")
+
     # Convert to list copy so original isn't modified
     c = list(c)
 
@@ -17,18 +31,430 @@ def root(c):
         # ax + b = 0 → -b / a
         return [-c[0] / c[1]]
 
-    # Normalize polynomial so leading term is 1
-    c = [ci / c[-1] for ci in c]
+    if method == 'aberth':
+        return aberth(c, **options)
+
+    roots = root_batch(np.array(c)[None, :])[0]
+    # like eigvals, stay real when every root is real
+    return roots.real if np.all(roots.imag == 0) else roots
+
+def root_batch(C):
+    # Roots of many polynomials of the same degree n at once.
+    # C is an (N, n+1) coefficient array, constant term first as in root().
+    # Returns an (N, n) complex array; rows whose leading coefficients are
+    # zero have lower degree and are padded with nan.
+    C = np.asarray(C)
+    C = C.astype(np.result_type(C, float))
+    rows, n = C.shape[0], C.shape[1] - 1
+    roots = np.full((rows, max(n, 0)), np.nan, dtype=complex)
+    if n <= 0 or rows == 0:
+        return roots
+
+    lead = C[:, -1]
+    full = np.abs(lead) >= 1e-14
+    if n == 1:
+        roots[full, 0] = -C[full, 0] / lead[full]
+    elif np.any(full):
+        # Normalize so the leading term is 1 and stack one companion matrix per row
+        c = C[full, :-1] / lead[full, None]
+        companion = np.zeros((len(c), n, n), dtype=c.dtype)
+        companion[:, 1:, :-1] = np.eye(n - 1)
+        companion[:, 0, :] = -c[:, ::-1]
+        # Eigenvalues = roots, one stacked call for all rows
+        roots[full] = np.linalg.eigvals(companion)
+
+    # Rows with a zero leading coefficient drop one degree and try again
+    if not np.all(full):
+        roots[~full, :n - 1] = root_batch(C[~full, :-1])
+    return roots
+
+# ==================== POLYNOMIAL EVALUATION ====================
+def _two_sum(a, b):
+    # a + b = s + e exactly (Knuth)
+    s = a + b
+    z = s - a
+    return s, (a - (s - z)) + (b - z)
+
+def _split(a):
+    # a = hi + lo with both halves 26 bits wide (Dekker)
+    c = 134217729.0 * a
+    hi = c - (c - a)
+    return hi, a - hi
+
+def _two_prod(a, b):
+    # a * b = p + e exactly (Dekker)
+    p = a * b
+    ah, al = _split(a)
+    bh, bl = _split(b)
+    return p, al * bl - (((p - ah * bh) - al * bh) - ah * bl)
+
+def _horner(c, x, column):
+    p = column(c, -1) + 0 * x
+    for k in range(c.shape[-1] - 2, -1, -1):
+        p = p * x + column(c, k)
+    return p
+
+def _comp_horner(c, x, column):
+    # Compensated Horner (Graillat, Langlois, Louvet 2005): as accurate as
+    # Horner in twice the working precision
+    s = column(c, -1) + 0 * x
+    r = np.zeros_like(s)
+    for k in range(c.shape[-1] - 2, -1, -1):
+        p, pi = _two_prod(s, x)
+        s, sigma = _two_sum(p, column(c, k))
+        r = r * x + (pi + sigma)
+    return s + r
+
+def _estrin(c, x, column):
+    # Estrin's scheme: combine coefficient pairs with x, x^2, x^4, ...
+    # O(log n) NumPy calls, but O(n * len(x)) memory
+    terms = [column(c, k) + 0 * x for k in range(c.shape[-1])]
+    power = x
+    while len(terms) > 1:
+        if len(terms) % 2:
+            terms.append(np.zeros_like(terms[0]))
+        terms = [terms[i] + terms[i + 1] * power for i in range(0, len(terms), 2)]
+        power = power * power
+    return terms[0]
+
+def polyval_sparse(terms, x):
+    # Evaluate sum(c * x**k) for a sparse polynomial given as {k: c} or as
+    # a pair of (exponents, coefficients) arrays; each term costs one
+    # floating-point power x**k, so x**10000 - 1 costs two terms, not 10001.
+    if isinstance(terms, dict):
+        exponents, coeffs = list(terms.keys()), list(terms.values())
+    else:
+        exponents, coeffs = terms
+    # cast x to the float/complex result type first, so integer powers do
+    # not wrap around in int64
+    x = np.asarray(x)
+    x = x.astype(np.result_type(x, np.asarray(coeffs), float), copy=False)
+    total = np.zeros(x.shape, dtype=x.dtype)
+    for k, ck in zip(exponents, coeffs):
+        total = total + ck * x ** int(k)
+    return total
+
+def polyval(c, x, scheme='auto', compensated=False):
+    # Evaluate polynomials (constant term first, as in root()) at many points.
+    # c is one coefficient vector, or an (N, n+1) array of N polynomials.
+    # For one polynomial the result has the shape of x.  For N polynomials x
+    # is either 1-D (every polynomial at every point, result (N, len(x))) or
+    # (N, M) (row i of x for polynomial i).
+    # scheme: 'horner', 'estrin', 'sparse', or 'auto' (sparse when only a few
+    # coefficients are nonzero, Horner otherwise).  compensated=True uses
+    # compensated Horner for real inputs.
+    c = np.asarray(c)
+    x = np.asarray(x)
+    if c.ndim == 1:
+        column = lambda c, k: c[k]
+    else:
+        if x.ndim == 1:
+            x = x[None, :]
+        column = lambda c, k: c[:, k, None]
+    if compensated:
+        if np.iscomplexobj(c) or np.iscomplexobj(x):
+            raise ValueError("compensated evaluation needs real coefficients and points")
+        return _comp_horner(c.astype(float), x.astype(float), column)
+    n = c.shape[-1] - 1
+    if scheme == 'auto':
+        # each sparse term costs about log2(k) multiplications
+        sparse = c.ndim == 1 and np.count_nonzero(c) * max(np.log2(n + 1), 1) < n
+        scheme = 'sparse' if sparse else 'horner'
+    if scheme == 'sparse':
+        if c.ndim != 1:
+            raise ValueError("the sparse scheme takes a single coefficient vector")
+        k = np.flatnonzero(c)
+        return polyval_sparse((k, c[k]), x)
+    if scheme == 'horner':
+        return _horner(c, x, column)
+    if scheme == 'estrin':
+        return _estrin(c, x, column)
+    raise ValueError(f"unknown evaluation scheme: {scheme}")
 
-    # Build companion matrix
-    companion = np.zeros((n, n))
-    companion[1:, :-1] = np.eye(n - 1)
-    companion[0, :] = -np.array(c[:-1])
+# ==================== ABERTH-EHRLICH ====================
+AberthReport = namedtuple('AberthReport', ['iterations', 'converged', 'degree', 'max_correction'])
 
-    # Eigenvalues = roots
-    roots = np.linalg.eigvals(companion)
+def _newton_polygon_guesses(c):
+    # Initial guesses on circles whose radii come from the upper convex hull
+    # of the points (k, log|c[k]|), i.e. the Newton polygon (Bini, 1996).
+    n = len(c) - 1
+    k = np.flatnonzero(c)
+    logs = np.log(np.abs(c[k]))
+    hull = []
+    for i in range(len(k)):
+        # drop points that fall below the segment to the new point
+        while len(hull) >= 2:
+            a, b = hull[-2], hull[-1]
+            if (logs[b] - logs[a]) * (k[i] - k[a]) <= (logs[i] - logs[a]) * (k[b] - k[a]):
+                hull.pop()
+            else:
+                break
+        hull.append(i)
+    guesses = []
+    for a, b in zip(hull[:-1], hull[1:]):
+        m = k[b] - k[a]
+        radius = np.exp((logs[a] - logs[b]) / m)
+        angles = 2*np.pi * np.arange(m) / m + 2*np.pi * k[a] / n + 0.7
+        guesses.append(radius * np.exp(1j * angles))
+    return np.concatenate(guesses)
+
+def _newton_ratio(c, z):
+    # p(z) / p'(z) by Horner's rule.  Points outside the unit circle use the
+    # reversed polynomial in w = 1/z so that z**n never overflows:
+    # p'/p = w * (n - w * q'(w) / q(w)).
+    n = len(c) - 1
+    ratio = np.empty_like(z)
+    inside = np.abs(z) <= 1
+    for mask, coeffs, x in ((inside, c[::-1], z[inside]), (~inside, c, 1 / z[~inside])):
+        if not len(x):
+            continue
+        p = np.full_like(x, coeffs[0])
+        dp = np.zeros_like(x)
+        for a in coeffs[1:]:
+            dp = dp * x + p
+            p = p * x + a
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if mask is inside:
+                ratio[mask] = p / dp
+            else:
+                ratio[mask] = 1 / (x * (n - x * dp / p))
+    return ratio
+
+def _aberth_sums(z, active, budget=8 << 20):
+    # sum over j != i of 1 / (z[i] - z[j]) for every active i, computed in
+    # blocks of rows whose complex (rows, n) temporary fits in budget bytes
+    idx = np.flatnonzero(active)
+    sums = np.empty(len(idx), dtype=complex)
+    block = max(1, budget // (16 * len(z)))
+    for start in range(0, len(idx), block):
+        rows = idx[start:start + block]
+        diff = z[rows, None] - z[None, :]
+        diff[np.arange(len(rows)), rows] = np.inf
+        sums[start:start + block] = np.reciprocal(diff, out=diff).sum(axis=1)
+    return sums
+
+def aberth(c, tol=1e-12, max_iter=100, polish=0, report=False):
+    # Simultaneous root finding with the Aberth-Ehrlich iteration.
+    # c holds the coefficients constant term first, as in root().
+    # Each sweep is O(n^2) time and O(n) memory.  Roots stop moving once
+    # their correction falls below tol * |z|; polish adds that many plain
+    # Newton steps at the end.  With report=True also returns an
+    # AberthReport(iterations, converged, degree, max_correction).
+    c = np.trim_zeros(np.asarray(c, dtype=complex), 'b')
+    zeros = len(c) - len(np.trim_zeros(c, 'f'))
+    c = c[zeros:]  # roots at 0 factor out as x**zeros
+    n = len(c) - 1
+    z = _newton_polygon_guesses(c) if n > 0 else np.zeros(0, dtype=complex)
+    active = np.ones(n, dtype=bool)
+    correction = np.zeros(n)
+    iterations = 0
+    while iterations < max_iter and np.any(active):
+        iterations += 1
+        ratio = _newton_ratio(c, z[active])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = ratio / (1 - ratio * _aberth_sums(z, active))
+        step[~np.isfinite(step)] = 0
+        z[active] -= step
+        correction[active] = np.abs(step)
+        done = correction[active] <= tol * np.abs(z[active])
+        active[np.flatnonzero(active)[done]] = False
+    for _ in range(polish):
+        step = _newton_ratio(c, z)
+        z -= np.where(np.isfinite(step), step, 0)
+    roots = np.concatenate([np.zeros(zeros, dtype=complex), z])
+    if report:
+        info = AberthReport(iterations, n - int(np.count_nonzero(active)), n + zeros,
+                            float(correction.max()) if n else 0.0)
+        return roots, info
     return roots
 
-# Example: x^3 - 6x^2 + 11x - 6 has roots 1, 2, 3
-coeffs = [-6, 11, -6, 1]
-print(root(coeffs))
+# ==================== UNIFIED SOLVER ====================
+# Degree <= 'closed_form' goes to the closed-form kernels of Homework 02/03
+# (badly scaled cubics excepted), degree <= 'iterative' to stacked companion
+# matrices, anything higher to aberth().  tune_thresholds() measures the crossovers on this machine.
+SOLVER_THRESHOLDS = {'closed_form': 3, 'iterative': 300}
+
+_HOMEWORK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_loaded = {}
+
+def _load_homework(number):
+    # Import a sibling homework script (e.g. Homework/02/Homework 02.py)
+    if number not in _loaded:
+        name = f"homework_{number:02d}"
+        path = os.path.join(_HOMEWORK_DIR, f"{number:02d}", f"Homework {number:02d}.py")
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        _loaded[number] = module
+    return _loaded[number]
+
+def _solve_rows(coeffs, thresholds=None):
+    # Roots of every row of an (N, n+1) coefficient array as an (N, n)
+    # complex array; rows of lower degree are padded with nan.
+    thresholds = thresholds or SOLVER_THRESHOLDS
+    rows, n = coeffs.shape[0], coeffs.shape[1] - 1
+    out = np.full((rows, max(n, 0)), np.nan, dtype=complex)
+    if n <= 0:
+        return out
+    if n == 1:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            out[:, 0] = -coeffs[:, 0] / coeffs[:, 1]
+    elif n == 2 and n <= thresholds['closed_form']:
+        x1, x2 = _load_homework(2).root2_batch(coeffs[:, 2], coeffs[:, 1], coeffs[:, 0])
+        out[:, 0], out[:, 1] = x1, x2
+    elif n == 3 and n <= thresholds['closed_form']:
+        # root3_batch gives nan for a == 0; those rows drop one degree, as in root_batch()
+        lead = np.abs(coeffs[:, 3])
+        full = lead >= 1e-14
+        # a tiny next to b or c sends one root towards infinity; companion
+        # matrices handle that without the overflow-prone p and q of the closed form
+        closed = full & (lead >= 1e-3 * np.maximum(np.abs(coeffs[:, 2]), np.abs(coeffs[:, 1])))
+        c = coeffs[closed]
+        out[closed] = _load_homework(3).root3_batch(c[:, 3], c[:, 2], c[:, 1], c[:, 0])
+        if not np.all(closed == full):
+            out[full & ~closed] = root_batch(coeffs[full & ~closed])
+        if not np.all(full):
+            out[~full, :2] = _solve_rows(coeffs[~full, :3], thresholds)
+    elif n <= thresholds['iterative']:
+        out[:] = root_batch(coeffs)
+    else:
+        for i, c in enumerate(coeffs):
+            r = aberth(c)
+            out[i, :len(r)] = r
+    return out
+
+def solve_polynomial(coeffs, thresholds=None):
+    # Roots of one polynomial (constant term first, as in root()) or of a
+    # batch of polynomials of any mix of degrees.
+    # A single coefficient vector gives a complex array of its roots; a 2-D
+    # array or a list of vectors gives a list with one such array per row.
+    # Leading zeros are trimmed, so a row of degree d always yields exactly
+    # d roots, and constant polynomials yield none.  Rows are grouped by
+    # degree and each group is solved in one call.
+    single = all(np.ndim(c) == 0 for c in coeffs)
+    polys = [np.atleast_1d(np.asarray(c)) for c in ([coeffs] if single else coeffs)]
+    groups = {}
+    for i, c in enumerate(polys):
+        big = np.flatnonzero(np.abs(c) >= 1e-14)
+        degree = int(big[-1]) if len(big) else 0
+        groups.setdefault(degree, []).append(i)
+    results = [None] * len(polys)
+    for degree, members in groups.items():
+        stacked = np.array([polys[i][:degree + 1] for i in members])
+        for i, r in zip(members, _solve_rows(stacked, thresholds)):
+            results[i] = r
+    return results[0] if single else results
+
+def tune_thresholds(max_degree=1024, batch=2000, repeats=3, seed=0):
+    # Micro-benchmark that sets SOLVER_THRESHOLDS for this machine:
+    # closed forms vs companion matrices for a batch of quadratics and
+    # cubics, then companion matrices vs aberth() for single polynomials
+    # of doubling degree.  Returns the updated thresholds.
+    rng = np.random.default_rng(seed)
+
+    def best(fn, *args):
+        times = []
+        for _ in range(repeats):
+            t = time.perf_counter()
+            fn(*args)
+            times.append(time.perf_counter() - t)
+        return min(times)
+
+    closed_form = 1
+    for n in (2, 3):
+        C = rng.standard_normal((batch, n + 1))
+        closed = best(_solve_rows, C, {'closed_form': n, 'iterative': n})
+        if closed < best(root_batch, C):
+            closed_form = n
+    iterative = max_degree
+    n = 16
+    while n <= max_degree:
+        C = rng.standard_normal((1, n + 1))
+        if best(aberth, C[0]) < best(root_batch, C):
+            iterative = n // 2
+            break
+        n *= 2
+    SOLVER_THRESHOLDS.update(closed_form=closed_form, iterative=max(iterative, closed_form))
+    return dict(SOLVER_THRESHOLDS)
+
+# ==================== STREAMING SOLVER PIPELINE ====================
+# Coefficient files hold one polynomial per row in the same order as root():
+# constant term first, leading coefficient last.
+def _csv_rows(path):
+    with open(path) as fh:
+        return sum(1 for line in fh if line.strip())
+
+def _iter_chunks(path, cols, chunk_rows):
+    # Yield (rows, cols, chunk iterator) for a .npy, raw float64 or .csv file.
+    # Binary files are memory-mapped; CSV files are read chunk_rows at a time.
+    # Blank CSV lines are skipped here and in _csv_rows(), so the row count
+    # and the chunks agree.
+    if path.endswith('.csv'):
+        rows = _csv_rows(path)
+        def chunks():
+            with open(path) as fh:
+                lines = (line for line in fh if line.strip())
+                for _ in range(0, rows, chunk_rows):
+                    yield np.loadtxt(itertools.islice(lines, chunk_rows), delimiter=',', ndmin=2)
+        with open(path) as fh:
+            first = next((line for line in fh if line.strip()), '')
+        return rows, len(first.split(',')), chunks()
+    if path.endswith('.npy'):
+        data = np.load(path, mmap_mode='r')
+    else:
+        if cols is None:
+            raise ValueError("raw binary input needs the number of columns")
+        data = np.memmap(path, dtype=np.float64, mode='r').reshape(-1, cols)
+    if data.ndim != 2:
+        raise ValueError(f"expected a 2-D coefficient table, got shape {data.shape}")
+    rows, cols = data.shape
+    return rows, cols, (np.asarray(data[i:i + chunk_rows], dtype=float) for i in range(0, rows, chunk_rows))
+
+def solve_file(src, dst, cols=None, chunk_rows=65536, report=print):
+    # Solve every polynomial in src and write the roots to dst, a .npy file
+    # of shape (rows, degree) opened as a memmap.  Only one chunk of input
+    # and output is in memory at a time.  Returns (rows, seconds).
+    start_time = time.perf_counter()
+    rows, cols, chunks = _iter_chunks(src, cols, chunk_rows)
+    out = np.lib.format.open_memmap(dst, mode='w+', dtype=complex, shape=(rows, cols - 1))
+    done = 0
+    for chunk in chunks:
+        out[done:done + len(chunk)] = _solve_rows(chunk)
+        done += len(chunk)
+    out.flush()
+    del out
+    elapsed = time.perf_counter() - start_time
+    if report:
+        report(f"{rows} rows in {elapsed:.3f} s ({rows / max(elapsed, 1e-9):,.0f} rows/s)")
+    return rows, elapsed
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve a file of polynomial coefficients, one polynomial per row "
+                                                 "(constant term first).")
+    parser.add_argument('input', nargs='?', help=".npy, .csv, or raw float64 file (needs --cols)")
+    parser.add_argument('output', nargs='?', help="output .npy file of complex roots")
+    parser.add_argument('--cols', type=int, help="coefficients per row for raw binary input")
+    parser.add_argument('--chunk-rows', type=int, default=65536, help="rows solved per chunk")
+    parser.add_argument('--tune', action='store_true', help="benchmark the solvers and set the degree thresholds first")
+    args = parser.parse_args(argv)
+    if args.tune:
+        print("solver thresholds:", tune_thresholds())
+    if args.input is None:
+        if not args.tune:
+            parser.error("input and output files are required")
+        return
+    if args.output is None:
+        parser.error("output file is required")
+    solve_file(args.input, args.output, args.cols, args.chunk_rows)
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        main()
+    else:
+        # Example: x^3 - 6x^2 + 11x - 6 has roots 1, 2, 3
+        coeffs = [-6, 11, -6, 1]
+        print(root(coeffs))
+        print(solve_polynomial([[6, -5, 1], [-6, 11, -6, 1], [2, 3], [1, 0, 0, 0, 1]]))
+        # Residuals |p(r)| at the roots
+        print(np.abs(polyval(coeffs, root(coeffs), compensated=True)))
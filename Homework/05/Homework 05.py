@@ -1,8 +1,16 @@
 
 # finite_field_complete.py
 import math
+import os
+import pickle
 import random
+import time
 from abc import ABC, abstractmethod
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
 
 # ==================== GROUP BASE CLASS ====================
 class Group(ABC):
@@ -29,14 +37,38 @@ class Group(ABC):
         """Check if element belongs to the group"""
         pass
     
+    @property
+    def order(self):
+        """Number of elements of the group"""
+        return len(self._element_list())
+    
+    def element_at(self, index):
+        """Element number index (0 <= index < order) of a fixed enumeration of the group"""
+        return self._element_list()[index]
+    
+    def __iter__(self):
+        """Lazily enumerate the elements in element_at order"""
+        for index in range(self.order):
+            yield self.element_at(index)
+    
     def random_generate(self):
         """Randomly generate an element from the group"""
-        elements = self._get_all_elements()
-        return random.choice(elements)
+        return self.element_at(random.randrange(self.order))
+    
+    def random_sample(self, n):
+        """n independent random elements (array-backed where the group has an array type)"""
+        return [self.random_generate() for _ in range(n)]
     
     def _get_all_elements(self):
         """Helper method to get all elements (for finite groups)"""
         raise NotImplementedError("Subclasses should implement this for finite groups")
+    
+    def _element_list(self):
+        # fallback for subclasses that implement only _get_all_elements: build the list once
+        elements = getattr(self, '_element_cache', None)
+        if elements is None:
+            elements = self._element_cache = self._get_all_elements()
+        return elements
 
 # ==================== GROUP AXIOMS TESTING ====================
 NUM_TEST_CASES = 50  # Reduced for finite fields
@@ -116,31 +148,189 @@ def check_commutative_group(g):
     check_commutativity(g)
     print("All commutative group axioms passed!")
 
+# ==================== FIELD REGISTRY ====================
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_MR_LIMIT = 3317044064679887385961981  # first composite these bases miss
+
+def is_prime(n):
+    """Miller-Rabin primality test, deterministic below 3.3 * 10**24"""
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    bases = _MR_BASES
+    if n >= _MR_LIMIT:
+        # beyond the proven range add random bases (error < 4**-32)
+        bases += tuple(random.randrange(2, n - 1) for _ in range(32))
+    for a in bases:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+class FieldDescriptor:
+    """Shared description of GF(p); one instance per prime, compared by identity"""
+    __slots__ = ('prime', 'pow_tables', 'tables', 'ntt', 'order_factors', 'dlog_tables')
+    
+    def __init__(self, prime):
+        self.prime = prime
+        self.pow_tables = {}       # base value -> FixedBasePow
+        self.tables = None         # FieldTables, built on first request
+        self.ntt = {}              # transform size -> NTT plan
+        self.order_factors = None  # factorization of p - 1, see field_order_factors
+        self.dlog_tables = {}      # (generator, order) -> baby-step table, see _bsgs
+    
+    def __repr__(self):
+        return f"FieldDescriptor({self.prime})"
+    
+    def __reduce__(self):
+        # unpickle to the interned descriptor of the receiving process
+        return (field_descriptor, (self.prime,))
+
+_FIELD_REGISTRY = {}
+
+def field_descriptor(prime):
+    """Return the interned descriptor of GF(prime), validating prime only once"""
+    if isinstance(prime, FieldDescriptor):
+        return prime
+    descriptor = _FIELD_REGISTRY.get(prime)
+    if descriptor is None:
+        if not is_prime(prime):
+            raise ValueError(f"{prime} is not a prime number")
+        descriptor = _FIELD_REGISTRY.setdefault(prime, FieldDescriptor(prime))
+    return descriptor
+
+# ==================== LOG/ANTILOG TABLES ====================
+TABLE_PRIME_BOUND = 1 << 16  # FiniteField uses tables below this prime by default
+
+TRIAL_DIVISION_BOUND = 1000  # factorize strips factors below this before Pollard's rho
+
+def _pollard_rho(n):
+    """A non-trivial factor of the odd composite n (Brent's variant of Pollard's rho)"""
+    while True:
+        c = random.randrange(1, n)
+        y = random.randrange(n)
+        m, g, r, q = 128, 1, 1, 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # the batched gcd overshot: redo the last block one step at a time
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+
+def factorize(n):
+    """Prime factorization of n >= 1 as {prime: exponent}"""
+    factors = {}
+    d = 2
+    while d < TRIAL_DIVISION_BOUND and d * d <= n:
+        while n % d == 0:
+            factors[d] = factors.get(d, 0) + 1
+            n //= d
+        d += 1 if d == 2 else 2
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if m < TRIAL_DIVISION_BOUND ** 2 or is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        else:
+            d = _pollard_rho(m)
+            stack += [d, m // d]
+    return dict(sorted(factors.items()))
+
+def _prime_factors(n):
+    """Distinct prime factors of n"""
+    return list(factorize(n))
+
+def field_order_factors(prime):
+    """Factorization of p - 1, computed once and cached on the field descriptor"""
+    descriptor = field_descriptor(prime)
+    if descriptor.order_factors is None:
+        descriptor.order_factors = factorize(descriptor.prime - 1)
+    return descriptor.order_factors
+
+def primitive_root(prime):
+    """Smallest generator of the multiplicative group of GF(prime)"""
+    if prime == 2:
+        return 1
+    factors = field_order_factors(prime)
+    for g in range(2, prime):
+        if all(pow(g, (prime - 1) // q, prime) != 1 for q in factors):
+            return g
+    raise ValueError(f"{prime} has no primitive root")
+
+class FieldTables:
+    """exp/log/inverse tables of GF(p) for a primitive root g"""
+    __slots__ = ('generator', 'exp', 'log', 'inv', 'exp_array', 'log_array', 'inv_array')
+    
+    def __init__(self, prime):
+        order = prime - 1
+        self.generator = g = primitive_root(prime)
+        # exp covers 0 .. 2*(p-1) - 1 so log[a] + log[b] needs no reduction
+        exp = [1] * (2 * order)
+        for i in range(1, 2 * order):
+            exp[i] = exp[i - 1] * g % prime
+        log = [0] * prime
+        for i in range(order):
+            log[exp[i]] = i
+        inv = [0] * prime
+        for v in range(1, prime):
+            inv[v] = exp[order - log[v]]
+        self.exp, self.log, self.inv = exp, log, inv
+        # NumPy copies for GFArray
+        self.exp_array = np.array(exp, dtype=np.int64)
+        self.log_array = np.array(log, dtype=np.int64)
+        self.inv_array = np.array(inv, dtype=np.int64)
+
+def field_tables(prime):
+    """Tables of GF(prime), built once and cached on the field descriptor"""
+    descriptor = field_descriptor(prime)
+    if descriptor.tables is None:
+        descriptor.tables = FieldTables(descriptor.prime)
+    return descriptor.tables
+
 # ==================== FINITE FIELD IMPLEMENTATION ====================
 class FiniteFieldElement:
     """Represents an element in a finite field GF(p)"""
     
     def __init__(self, value, prime):
-        if not self._is_prime(prime):
-            raise ValueError(f"{prime} is not a prime number")
+        # prime may be an int or the FieldDescriptor of the field
+        field = prime if type(prime) is FieldDescriptor else field_descriptor(prime)
+        prime = field.prime
         if value < 0 or value >= prime:
             value %= prime
         self.value = value
         self.prime = prime
-    
-    def _is_prime(self, n):
-        """Simple primality test"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        return all(n % i != 0 for i in range(3, int(n**0.5) + 1, 2))
+        self.field = field
     
     def __eq__(self, other):
         if isinstance(other, FiniteFieldElement):
-            return self.value == other.value and self.prime == other.prime
+            return self.field is other.field and self.value == other.value
         return self.value == other
     
     def __repr__(self):
@@ -153,20 +343,9 @@ class FiniteFieldAddGroup(Group):
     """Additive group of finite field GF(p)"""
     
     def __init__(self, prime):
-        if not self._is_prime(prime):
-            raise ValueError(f"{prime} is not a prime number")
-        self._prime = prime
-        self._identity = FiniteFieldElement(0, prime)
-    
-    def _is_prime(self, n):
-        """Simple primality test"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        return all(n % i != 0 for i in range(3, int(n**0.5) + 1, 2))
+        self._field = field_descriptor(prime)
+        self._prime = self._field.prime
+        self._identity = FiniteFieldElement(0, self._field)
     
     @property
     def identity(self):
@@ -175,42 +354,40 @@ class FiniteFieldAddGroup(Group):
     def operation(self, a, b):
         if not (self.include(a) and self.include(b)):
             raise TypeError("Elements must be from this field")
-        return FiniteFieldElement((a.value + b.value) % self._prime, self._prime)
+        return FiniteFieldElement((a.value + b.value) % self._prime, self._field)
     
     def inverse(self, a):
         if not self.include(a):
             raise TypeError("Element must be from this field")
-        return FiniteFieldElement((-a.value) % self._prime, self._prime)
+        return FiniteFieldElement((-a.value) % self._prime, self._field)
     
     def include(self, element):
         return (isinstance(element, FiniteFieldElement) and 
-                element.prime == self._prime)
+                element.field is self._field)
     
-    def random_generate(self):
-        value = random.randint(0, self._prime - 1)
-        return FiniteFieldElement(value, self._prime)
+    @property
+    def order(self):
+        return self._prime
+    
+    def element_at(self, index):
+        if not 0 <= index < self._prime:
+            raise IndexError("Group element index out of range")
+        return FiniteFieldElement(index, self._field)
+    
+    def random_sample(self, n):
+        return GFArray.random(FiniteField(self._field), (n,))
     
     def _get_all_elements(self):
-        return [FiniteFieldElement(i, self._prime) for i in range(self._prime)]
+        return [FiniteFieldElement(i, self._field) for i in range(self._prime)]
 
 class FiniteFieldMulGroup(Group):
     """Multiplicative group of finite field GF(p) (excluding 0)"""
     
-    def __init__(self, prime):
-        if not self._is_prime(prime):
-            raise ValueError(f"{prime} is not a prime number")
-        self._prime = prime
-        self._identity = FiniteFieldElement(1, prime)
-    
-    def _is_prime(self, n):
-        """Simple primality test"""
-        if n < 2:
-            return False
-        if n == 2:
-            return True
-        if n % 2 == 0:
-            return False
-        return all(n % i != 0 for i in range(3, int(n**0.5) + 1, 2))
+    def __init__(self, prime, tables=None):
+        self._field = field_descriptor(prime)
+        self._prime = self._field.prime
+        self._identity = FiniteFieldElement(1, self._field)
+        self._tables = tables
     
     @property
     def identity(self):
@@ -219,41 +396,153 @@ class FiniteFieldMulGroup(Group):
     def operation(self, a, b):
         if not (self.include(a) and self.include(b)):
             raise TypeError("Elements must be from this field and non-zero")
-        return FiniteFieldElement((a.value * b.value) % self._prime, self._prime)
+        if self._tables is not None:
+            tables = self._tables
+            return FiniteFieldElement(tables.exp[tables.log[a.value] + tables.log[b.value]], self._field)
+        return FiniteFieldElement((a.value * b.value) % self._prime, self._field)
     
     def inverse(self, a):
         if not self.include(a):
             raise TypeError("Element must be from this field and non-zero")
         if a.value == 0:
             raise ValueError("Zero has no multiplicative inverse")
+        if self._tables is not None:
+            return FiniteFieldElement(self._tables.inv[a.value], self._field)
         
         # Use Fermat's Little Theorem: a^(p-2) is the inverse of a
         inverse_value = pow(a.value, self._prime - 2, self._prime)
-        return FiniteFieldElement(inverse_value, self._prime)
+        return FiniteFieldElement(inverse_value, self._field)
+    
+    def batch_inverse(self, elements):
+        """Invert many elements with one exponentiation (Montgomery's trick)
+        
+        elements is a list of FiniteFieldElement / FiniteFieldNumber, or a
+        GFArray; the result has the same form.  Zero elements raise ValueError.
+        """
+        if isinstance(elements, GFArray):
+            return self._batch_inverse_array(elements)
+        values = []
+        for i, e in enumerate(elements):
+            element = e.element if isinstance(e, FiniteFieldNumber) else e
+            if not (isinstance(element, FiniteFieldElement) and element.field is self._field):
+                raise TypeError(f"Element {i} is not from this field")
+            if element.value == 0:
+                raise ValueError(f"Zero has no multiplicative inverse (element {i})")
+            values.append(element.value)
+        prime = self._prime
+        # prefix[i] = values[0] * ... * values[i-1]
+        prefix = []
+        acc = 1
+        for v in values:
+            prefix.append(acc)
+            acc = acc * v % prime
+        inv = pow(acc, prime - 2, prime)
+        result = [None] * len(values)
+        for i in range(len(values) - 1, -1, -1):
+            value = FiniteFieldElement(inv * prefix[i] % prime, self._field)
+            e = elements[i]
+            result[i] = FiniteFieldNumber(e.field, value) if isinstance(e, FiniteFieldNumber) else value
+            inv = inv * values[i] % prime
+        return result
+    
+    def _batch_inverse_array(self, elements):
+        """Montgomery's trick on a product tree: O(log n) vectorized passes"""
+        if elements.field.descriptor is not self._field:
+            raise TypeError("Elements must be from this field")
+        data = elements.data.ravel()
+        zeros = np.flatnonzero(data == 0)
+        if len(zeros):
+            raise ValueError(f"Zero has no multiplicative inverse (element {zeros[0]})")
+        if not len(data):
+            return GFArray._wrap(elements.field, elements.data.copy())
+        prime = self._prime
+        levels = []
+        level = data
+        while len(level) > 1:
+            if len(level) % 2:
+                level = np.concatenate([level, np.ones(1, dtype=level.dtype)])
+            levels.append(level)
+            level = _mulmod(level[0::2], level[1::2], prime)
+        inv = np.array([pow(int(level[0]), prime - 2, prime)], dtype=data.dtype)
+        for level in reversed(levels):
+            inv = inv[:len(level) // 2]  # drop the inverse of any padding
+            children = np.empty(len(level), dtype=data.dtype)
+            children[0::2] = _mulmod(inv, level[1::2], prime)
+            children[1::2] = _mulmod(inv, level[0::2], prime)
+            inv = children
+        return GFArray._wrap(elements.field, inv[:len(data)].reshape(elements.shape))
+    
+    def element_order(self, a):
+        """Smallest k > 0 with a^k = 1"""
+        if not self.include(a):
+            raise TypeError("Element must be from this field and non-zero")
+        return multiplicative_order(a.value, self._prime)
+    
+    def is_generator(self, a):
+        return self.element_order(a) == self._prime - 1
+    
+    def generator(self):
+        """The smallest primitive root"""
+        if self._tables is not None:
+            return FiniteFieldElement(self._tables.generator, self._field)
+        return FiniteFieldElement(primitive_root(self._prime), self._field)
+    
+    def discrete_log(self, a, base=None, method='auto', report=False):
+        """x with base^x = a (base defaults to the smallest generator); see discrete_log"""
+        base = self.generator() if base is None else base
+        if not (self.include(a) and self.include(base)):
+            raise TypeError("Elements must be from this field and non-zero")
+        if self._tables is not None and method == 'auto' and not report:
+            # log tables answer directly: solve log(base) * x = log(a) mod p - 1
+            log_a, log_base = self._tables.log[a.value], self._tables.log[base.value]
+            d = math.gcd(log_base, self._prime - 1)
+            if log_a % d:
+                raise ValueError(f"{a} is not a power of {base}")
+            n = (self._prime - 1) // d
+            return log_a // d * pow(log_base // d, -1, n) % n if n > 1 else 0
+        return discrete_log(a.value, base.value, self._prime, method, report)
     
     def include(self, element):
         return (isinstance(element, FiniteFieldElement) and 
-                element.prime == self._prime and 
+                element.field is self._field and 
                 element.value != 0)
     
-    def random_generate(self):
-        value = random.randint(1, self._prime - 1)
-        return FiniteFieldElement(value, self._prime)
+    @property
+    def order(self):
+        return self._prime - 1
+    
+    def element_at(self, index):
+        if not 0 <= index < self._prime - 1:
+            raise IndexError("Group element index out of range")
+        return FiniteFieldElement(index + 1, self._field)
+    
+    def random_sample(self, n):
+        field = FiniteField(self._field, use_tables=self._tables is not None)
+        if self._prime < _INT64_SPLIT:
+            data = np.random.randint(1, self._prime, size=n, dtype=np.int64)
+        else:
+            data = np.array([random.randrange(1, self._prime) for _ in range(n)], dtype=object)
+        return GFArray._wrap(field, data)
     
     def _get_all_elements(self):
-        return [FiniteFieldElement(i, self._prime) for i in range(1, self._prime)]
+        return [FiniteFieldElement(i, self._field) for i in range(1, self._prime)]
 
 class FiniteField:
     """Finite field GF(p) combining additive and multiplicative groups"""
     
-    def __init__(self, prime):
-        self.prime = prime
-        self.add_group = FiniteFieldAddGroup(prime)
-        self.mul_group = FiniteFieldMulGroup(prime)
+    def __init__(self, prime, use_tables=None):
+        self.descriptor = field_descriptor(prime)
+        self.prime = self.descriptor.prime
+        # log/exp tables turn *, /, inverse and pow into lookups (small p only)
+        if use_tables is None:
+            use_tables = self.prime < TABLE_PRIME_BOUND
+        self.tables = field_tables(self.descriptor) if use_tables else None
+        self.add_group = FiniteFieldAddGroup(self.descriptor)
+        self.mul_group = FiniteFieldMulGroup(self.descriptor, self.tables)
     
     def element(self, value):
         """Create a finite field element"""
-        return FiniteFieldElement(value, self.prime)
+        return FiniteFieldElement(value, self.descriptor)
     
     def random_element(self):
         """Generate a random element"""
@@ -262,8 +551,227 @@ class FiniteField:
     def random_nonzero_element(self):
         """Generate a random non-zero element"""
         return self.mul_group.random_generate()
+    
+    def array(self, values):
+        """Create a GFArray of elements of this field"""
+        return GFArray(self, values)
+    
+    def polynomial(self, coeffs):
+        """Create a GFPolynomial from coefficients, lowest degree first"""
+        return GFPolynomial(self, coeffs)
+    
+    def matrix(self, rows):
+        """Create a GFMatrix from a 2-D array of elements"""
+        return GFMatrix(self, rows)
+    
+    def precompute_base(self, base, window=4):
+        """Build a fixed-base table for base; later base ** e calls use it"""
+        value = base.value if isinstance(base, (FiniteFieldElement, FiniteFieldNumber)) else base % self.prime
+        table = FixedBasePow(value, self.prime, max(self.prime - 2, 1).bit_length(), window)
+        self.descriptor.pow_tables[value] = table
+        return table
+
+# ==================== EXPONENTIATION ====================
+def window_pow(base, exponent, modulus, window=None):
+    """Sliding-window exponentiation: base**exponent % modulus in O(log exponent) products"""
+    if exponent < 0:
+        raise ValueError("exponent must be non-negative")
+    base %= modulus
+    if exponent == 0:
+        return 1 % modulus
+    bits = exponent.bit_length()
+    if window is None:
+        window = 1 if bits <= 8 else 3 if bits <= 64 else 4 if bits <= 256 else 5
+    # odd powers base, base^3, ..., base^(2^window - 1)
+    square = base * base % modulus
+    odd = [base]
+    for _ in range((1 << (window - 1)) - 1):
+        odd.append(odd[-1] * square % modulus)
+    result = 1
+    i = bits - 1
+    while i >= 0:
+        if not (exponent >> i) & 1:
+            result = result * result % modulus
+            i -= 1
+            continue
+        # longest window of at most `window` bits from bit i down to a set bit j
+        j = max(i - window + 1, 0)
+        while not (exponent >> j) & 1:
+            j += 1
+        for _ in range(i - j + 1):
+            result = result * result % modulus
+        result = result * odd[((exponent >> j) & ((1 << (i - j + 1)) - 1)) >> 1] % modulus
+        i = j - 1
+    return result
+
+class FixedBasePow:
+    """Precomputed table base^(d * 2^(window*i)) for repeated powers of one base"""
+    
+    def __init__(self, base, modulus, max_bits, window=4):
+        self.base = base % modulus
+        self.modulus = modulus
+        self.window = window
+        self.max_bits = max_bits
+        self._table = []
+        row_base = self.base
+        for _ in range(-(-max_bits // window)):
+            row = [1]
+            for _ in range((1 << window) - 1):
+                row.append(row[-1] * row_base % modulus)
+            self._table.append(row)
+            row_base = row[-1] * row_base % modulus  # row_base^(2^window)
+    
+    def pow(self, exponent):
+        """base**exponent % modulus with one product per window and no squarings"""
+        if exponent < 0 or exponent.bit_length() > self.max_bits:
+            return window_pow(self.base, exponent, self.modulus)
+        result = 1
+        mask = (1 << self.window) - 1
+        for row in self._table:
+            if not exponent:
+                break
+            digit = exponent & mask
+            if digit:
+                result = result * row[digit] % self.modulus
+            exponent >>= self.window
+        return result % self.modulus
+
+# ==================== ORDERS AND DISCRETE LOGARITHMS ====================
+BSGS_TABLE_LIMIT = 1 << 20  # largest baby-step table; larger subgroups use Pollard's rho
+BSGS_CACHE_SIZE = 4  # baby-step tables kept per field, least recently used dropped first
+
+DlogReport = namedtuple('DlogReport', ['method', 'group_ops', 'table_entries', 'seconds'])
+
+def _divisor_factors(n, factors):
+    """Factorization of a divisor n of a number whose factorization is known"""
+    result = {}
+    for q in factors:
+        while n % q == 0:
+            result[q] = result.get(q, 0) + 1
+            n //= q
+    return result
+
+def multiplicative_order(a, prime):
+    """Order of a in the multiplicative group of GF(prime)"""
+    a %= prime
+    if a == 0:
+        raise ValueError("Zero has no multiplicative order")
+    n = prime - 1
+    for q, e in field_order_factors(prime).items():
+        for _ in range(e):
+            if pow(a, n // q, prime) != 1:
+                break
+            n //= q
+    return n
+
+def _bsgs(gamma, h, q, prime, stats):
+    """Baby-step giant-step in the subgroup of order q; tables are kept on the field descriptor"""
+    m = math.isqrt(q - 1) + 1
+    cache = field_descriptor(prime).dlog_tables
+    table = cache.pop((gamma, q), None)
+    if table is None:
+        table = {}
+        v = 1
+        for j in range(m):
+            table.setdefault(v, j)
+            v = v * gamma % prime
+        stats['ops'] += m
+        while len(cache) >= BSGS_CACHE_SIZE:
+            del cache[next(iter(cache))]
+    cache[(gamma, q)] = table  # reinserted, so dict order is least recently used first
+    stats['entries'] = max(stats['entries'], len(table))
+    giant = pow(gamma, -m % q, prime)  # gamma^-m
+    y = h
+    for i in range(m):
+        j = table.get(y)
+        if j is not None:
+            stats['ops'] += i
+            return (i * m + j) % q
+        y = y * giant % prime
+    raise ValueError("Logarithm not found")
+
+def _rho_log(gamma, h, q, prime, stats):
+    """Pollard's rho in the subgroup of prime order q: O(sqrt(q)) steps, O(1) memory"""
+    def step(x, a, b):
+        s = x % 3
+        if s == 0:
+            return x * x % prime, 2 * a % q, 2 * b % q
+        if s == 1:
+            return x * gamma % prime, (a + 1) % q, b
+        return x * h % prime, a, (b + 1) % q
+    while True:
+        a, b = random.randrange(q), random.randrange(q)
+        x = pow(gamma, a, prime) * pow(h, b, prime) % prime
+        X, A, B = x, a, b
+        while True:
+            x, a, b = step(x, a, b)
+            X, A, B = step(*step(X, A, B))
+            stats['ops'] += 3
+            if x == X:
+                break
+        # gamma^a h^b == gamma^A h^B
+        if (B - b) % q:
+            log = (a - A) * pow(B - b, q - 2, q) % q
+            if pow(gamma, log, prime) == h:
+                return log
+
+def _subgroup_log(gamma, h, q, prime, method, stats):
+    """log of h to the base gamma of prime order q"""
+    if h == 1:
+        return 0
+    if q <= 3:
+        return 1 if h == gamma else 2
+    if method == 'bsgs' or method == 'auto' and math.isqrt(q - 1) + 1 <= BSGS_TABLE_LIMIT:
+        stats['used'].add('bsgs')
+        return _bsgs(gamma, h, q, prime, stats)
+    stats['used'].add('rho')
+    return _rho_log(gamma, h, q, prime, stats)
+
+def discrete_log(h, g, prime, method='auto', report=False):
+    """x with g**x == h (mod prime), reduced modulo the order of g
+    
+    Pohlig-Hellman splits the problem into subgroups of prime order, each
+    solved by baby-step giant-step (method='bsgs', memory O(sqrt q)) or
+    Pollard's rho (method='rho', memory O(1)); 'auto' picks bsgs while its
+    table stays under BSGS_TABLE_LIMIT entries.  With report=True returns
+    (x, DlogReport).
+    """
+    if method not in ('auto', 'bsgs', 'rho'):
+        raise ValueError(f"Unknown method {method!r}")
+    start = time.perf_counter()
+    g %= prime
+    h %= prime
+    n = multiplicative_order(g, prime)
+    if h == 0 or pow(h, n, prime) != 1:
+        raise ValueError(f"{h} is not a power of {g} modulo {prime}")
+    stats = {'ops': 0, 'entries': 0, 'used': set()}
+    x, modulus = 0, 1
+    for q, e in _divisor_factors(n, field_order_factors(prime)).items():
+        gamma = pow(g, n // q, prime)  # generates the subgroup of order q
+        digits = 0
+        for k in range(e):
+            # (g^-digits h)^(n / q^(k+1)) lies in <gamma>
+            target = pow(h * pow(g, n - digits, prime) % prime, n // q ** (k + 1), prime)
+            digits += _subgroup_log(gamma, target, q, prime, method, stats) * q ** k
+        # combine with the result so far (Chinese remainder theorem)
+        qe = q ** e
+        x += modulus * ((digits - x) * pow(modulus, -1, qe) % qe)
+        modulus *= qe
+    x %= n
+    if not report:
+        return x
+    used = '+'.join(sorted(stats['used'])) or 'none'
+    return x, DlogReport(f"pohlig-hellman/{used}", stats['ops'], stats['entries'],
+                         time.perf_counter() - start)
 
 # ==================== OPERATOR OVERLOADING ====================
+def _field_mul(f, a, b):
+    """Field product that also accepts zero (the multiplicative group excludes it)"""
+    zero = f.add_group.identity
+    if a == zero or b == zero:
+        return zero
+    return f.mul_group.operation(a, b)
+
 class FiniteFieldNumber:
     """Finite field element with operator overloading"""
     
@@ -322,10 +830,10 @@ class FiniteFieldNumber:
     
     def __mul__(self, other):
         if isinstance(other, FiniteFieldNumber):
-            result = self.field.mul_group.operation(self.element, other.element)
+            result = _field_mul(self.field, self.element, other.element)
         else:
             other_elem = self.field.element(other)
-            result = self.field.mul_group.operation(self.element, other_elem)
+            result = _field_mul(self.field, self.element, other_elem)
         return FiniteFieldNumber(self.field, result)
     
     def __rmul__(self, other):
@@ -333,14 +841,14 @@ class FiniteFieldNumber:
     
     def __truediv__(self, other):
         if isinstance(other, FiniteFieldNumber):
-            result = self.field.mul_group.operation(
-                self.element, 
+            result = _field_mul(
+                self.field, self.element, 
                 self.field.mul_group.inverse(other.element)
             )
         else:
             other_elem = self.field.element(other)
-            result = self.field.mul_group.operation(
-                self.element, 
+            result = _field_mul(
+                self.field, self.element, 
                 self.field.mul_group.inverse(other_elem)
             )
         return FiniteFieldNumber(self.field, result)
@@ -350,19 +858,1520 @@ class FiniteFieldNumber:
         return other_num / self
     
     def __pow__(self, exponent):
-        if exponent < 0:
-            inverse = self.field.mul_group.inverse(self.element)
-            return FiniteFieldNumber(self.field, inverse) ** (-exponent)
+        value = self.value
+        prime = self.field.prime
+        if value == 0:
+            if exponent < 0:
+                self.field.mul_group.inverse(self.element)  # raises
+            return FiniteFieldNumber(self.field, 0 if exponent else 1)
         
-        result = self.field.mul_group.identity
-        for _ in range(exponent):
-            result = self.field.mul_group.operation(result, self.element)
-        return FiniteFieldNumber(self.field, result)
+        # Fermat: a^(p-1) = 1, so exponents (negative ones too) reduce mod p-1
+        exponent %= prime - 1
+        tables = self.field.tables
+        if tables is not None:
+            result = tables.exp[tables.log[value] * exponent % (prime - 1)]
+            return FiniteFieldNumber(self.field, FiniteFieldElement(result, self.field.descriptor))
+        table = self.field.descriptor.pow_tables.get(value)
+        if table is not None:
+            result = table.pow(exponent)
+        else:
+            result = window_pow(value, exponent, prime)
+        return FiniteFieldNumber(self.field, FiniteFieldElement(result, self.field.descriptor))
     
     def __neg__(self):
         inverse = self.field.add_group.inverse(self.element)
         return FiniteFieldNumber(self.field, inverse)
 
+# ==================== ARRAY-BACKED ELEMENTS ====================
+_INT64_DIRECT = 1 << 31   # below this, a * b fits in int64
+_INT64_SPLIT = 1 << 62    # below this, int64 with split products; above, Python ints
+
+def _mulmod(a, b, prime):
+    """Elementwise a * b % prime for residue arrays without int64 overflow"""
+    if prime < _INT64_DIRECT or np.asarray(a).dtype == object:
+        return a * b % prime
+    # multiply by b a few bits at a time so every partial product fits in int64
+    bits = prime.bit_length()
+    k = 63 - bits
+    mask = (1 << k) - 1
+    result = np.zeros(np.broadcast(a, b).shape, dtype=np.int64)
+    for shift in range((bits - 1) // k * k, -1, -k):
+        result = (result << k) % prime
+        result = (result + a * ((b >> shift) & mask) % prime) % prime
+    return result
+
+def _powmod(a, exponent, prime):
+    """Elementwise a ** exponent % prime by square-and-multiply"""
+    result = np.ones_like(a)
+    base = a
+    while exponent:
+        if exponent & 1:
+            result = _mulmod(result, base, prime)
+        base = _mulmod(base, base, prime)
+        exponent >>= 1
+    return result
+
+def _summod(a, prime):
+    """Sum of a residue array modulo prime, as a Python int"""
+    if a.dtype == object:
+        return int(a.sum()) % prime
+    # split into 31-bit halves so the int64 partial sums cannot overflow
+    lo = int((a & 0x7FFFFFFF).sum())
+    hi = int((a >> 31).sum())
+    return ((hi << 31) + lo) % prime
+
+def _to_residues(values, prime):
+    """Convert ints, field elements or arrays to an array of residues mod prime"""
+    big = prime >= _INT64_SPLIT
+    if isinstance(values, np.ndarray) and values.dtype.kind in 'iu' and not big:
+        return np.mod(values.astype(np.int64), prime)
+    obj = np.array(values, dtype=object)
+    to_int = np.frompyfunc(lambda v: int(getattr(v, 'value', v)) % prime, 1, 1)
+    obj = np.asarray(to_int(obj), dtype=object)
+    return obj if big else obj.astype(np.int64)
+
+class GFArray:
+    """NumPy array of GF(p) elements; int64 storage for p < 2^62, Python ints above"""
+    
+    def __init__(self, field, values):
+        self.field = field
+        if isinstance(values, GFArray):
+            values = values.data
+        self.data = _to_residues(values, field.prime)
+    
+    @classmethod
+    def _wrap(cls, field, data):
+        array = cls.__new__(cls)
+        array.field = field
+        array.data = data
+        return array
+    
+    @classmethod
+    def random(cls, field, shape):
+        """Uniformly random elements of the given shape"""
+        if field.prime < _INT64_SPLIT:
+            data = np.random.randint(0, field.prime, size=shape, dtype=np.int64)
+        else:
+            count = int(np.prod(shape))
+            data = np.array([random.randrange(field.prime) for _ in range(count)], dtype=object).reshape(shape)
+        return cls._wrap(field, data)
+    
+    @property
+    def shape(self):
+        return self.data.shape
+    
+    def __len__(self):
+        return len(self.data)
+    
+    def __repr__(self):
+        return f"GFArray(GF({self.field.prime}), {self.data.tolist()})"
+    
+    def __getitem__(self, index):
+        item = self.data[index]
+        if isinstance(item, np.ndarray):
+            return GFArray._wrap(self.field, item)
+        return FiniteFieldNumber(self.field, int(item))
+    
+    def __setitem__(self, index, value):
+        self.data[index] = self._coerce(value)
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+    
+    def _coerce(self, other):
+        if isinstance(other, GFArray):
+            if other.field.descriptor is not self.field.descriptor:
+                raise TypeError("Elements must be from this field")
+            return other.data
+        if isinstance(other, (FiniteFieldNumber, FiniteFieldElement)):
+            if other.field is not self.field.descriptor and getattr(other.field, 'descriptor', None) is not self.field.descriptor:
+                raise TypeError("Elements must be from this field")
+            return other.value
+        if isinstance(other, int):
+            return other % self.field.prime
+        return _to_residues(other, self.field.prime)
+    
+    def __add__(self, other):
+        return GFArray._wrap(self.field, (self.data + self._coerce(other)) % self.field.prime)
+    
+    def __radd__(self, other):
+        return self + other
+    
+    def __sub__(self, other):
+        return GFArray._wrap(self.field, (self.data - self._coerce(other)) % self.field.prime)
+    
+    def __rsub__(self, other):
+        return GFArray._wrap(self.field, (self._coerce(other) - self.data) % self.field.prime)
+    
+    def __neg__(self):
+        return GFArray._wrap(self.field, (-self.data) % self.field.prime)
+    
+    def __mul__(self, other):
+        other = self._coerce(other)
+        tables = self.field.tables
+        if tables is not None:
+            a, b = np.broadcast_arrays(self.data, np.asarray(other, dtype=np.int64))
+            product = tables.exp_array[tables.log_array[a] + tables.log_array[b]]
+            product[(a == 0) | (b == 0)] = 0
+            return GFArray._wrap(self.field, product)
+        return GFArray._wrap(self.field, _mulmod(self.data, other, self.field.prime))
+    
+    def __rmul__(self, other):
+        return self * other
+    
+    def inverse(self):
+        """Elementwise multiplicative inverse"""
+        if np.any(self.data == 0):
+            raise ValueError("Zero has no multiplicative inverse")
+        if self.field.tables is not None:
+            return GFArray._wrap(self.field, self.field.tables.inv_array[self.data])
+        return self.field.mul_group.batch_inverse(self)
+    
+    def __truediv__(self, other):
+        if not isinstance(other, GFArray):
+            other = GFArray(self.field, np.broadcast_to(np.asarray(self._coerce(other), dtype=self.data.dtype), self.shape))
+        return self * other.inverse()
+    
+    def __rtruediv__(self, other):
+        return self.inverse() * other
+    
+    def __pow__(self, exponent):
+        if exponent < 0:
+            return self.inverse() ** (-exponent)
+        reduced = exponent % (self.field.prime - 1)
+        if reduced == 0 and exponent:
+            reduced = self.field.prime - 1  # keeps 0 ** e == 0
+        tables = self.field.tables
+        if tables is not None:
+            result = tables.exp_array[tables.log_array[self.data] * reduced % (self.field.prime - 1)]
+            result[self.data == 0] = 0 if reduced else 1
+            return GFArray._wrap(self.field, result)
+        return GFArray._wrap(self.field, _powmod(self.data, reduced, self.field.prime))
+    
+    def __eq__(self, other):
+        return self.data == self._coerce(other)
+    
+    def sum(self):
+        """Sum of all elements as a FiniteFieldNumber"""
+        return FiniteFieldNumber(self.field, _summod(self.data, self.field.prime))
+    
+    def dot(self, other):
+        """Sum of elementwise products as a FiniteFieldNumber"""
+        products = _mulmod(self.data, self._coerce(other), self.field.prime)
+        return FiniteFieldNumber(self.field, _summod(np.asarray(products), self.field.prime))
+
+# ==================== POLYNOMIALS OVER GF(p) ====================
+SCHOOLBOOK_THRESHOLD = 256  # shorter factors are multiplied directly
+NEWTON_THRESHOLD = 64       # longer quotients use Newton inversion instead of long division
+EVAL_BLOCK = 64             # points per leaf of the multipoint-evaluation tree
+
+def _two_adic(prime):
+    """Largest power of two dividing prime - 1 (the longest NTT over GF(prime))"""
+    return (prime - 1) & -(prime - 1)
+
+def _power_table(w, count, prime):
+    """w^0, ..., w^(count-1) mod prime, doubling the table each step"""
+    table = np.ones(1, dtype=object if prime >= _INT64_SPLIT else np.int64)
+    while len(table) < count:
+        table = np.concatenate([table, _mulmod(table, pow(w, len(table), prime), prime)])
+    return table[:count]
+
+def _ntt_plan(prime, size):
+    """Bit-reversal order and twiddles of a size-point NTT, cached on the field descriptor"""
+    descriptor = field_descriptor(prime)
+    plan = descriptor.ntt.get(size)
+    if plan is None:
+        # z^((p-1)/size) has order exactly size iff its size/2-th power is -1
+        cofactor = (prime - 1) // size
+        z = 2
+        while pow(z, cofactor * (size // 2), prime) != prime - 1:
+            z += 1
+        w = pow(z, cofactor, prime)
+        bits = size.bit_length() - 1
+        index = np.arange(size)
+        order = np.zeros(size, dtype=np.int64)
+        for i in range(bits):
+            order |= ((index >> i) & 1) << (bits - 1 - i)
+        plan = (order,
+                _power_table(w, size // 2, prime),
+                _power_table(pow(w, prime - 2, prime), size // 2, prime))
+        descriptor.ntt[size] = plan
+    return plan
+
+def _ntt(a, prime, invert=False):
+    """Iterative radix-2 NTT of a (length a power of two), one vectorized pass per stage"""
+    size = len(a)
+    order, twiddles, inverse_twiddles = _ntt_plan(prime, size)
+    table = inverse_twiddles if invert else twiddles
+    a = a[order]
+    out = np.empty_like(a)
+    half = 1
+    while half < size:
+        blocks = a.reshape(-1, 2, half)
+        u = blocks[:, 0, :]
+        v = _mulmod(blocks[:, 1, :], table[::size // (2 * half)], prime)
+        butterflies = out.reshape(-1, 2, half)
+        np.add(u, v, out=butterflies[:, 0, :])
+        np.subtract(u, v, out=butterflies[:, 1, :])
+        np.remainder(out, prime, out=out)
+        a, out = out, a
+        half *= 2
+    if invert:
+        a = _mulmod(a, pow(size, prime - 2, prime), prime)
+    return a
+
+def _schoolbook(a, b, prime):
+    """Direct convolution mod prime"""
+    if a.dtype == object or prime >= _INT64_DIRECT:
+        product = np.convolve(a.astype(object), b.astype(object)) % prime
+        return product if a.dtype == object else product.astype(np.int64)
+    # 16-bit limbs keep every partial sum of np.convolve inside int64
+    a0, a1 = a & 0xFFFF, a >> 16
+    b0, b1 = b & 0xFFFF, b >> 16
+    low = np.convolve(a0, b0) % prime
+    mid = (np.convolve(a0, b1) + np.convolve(a1, b0)) % prime
+    high = np.convolve(a1, b1) % prime
+    return ((high * ((1 << 32) % prime) % prime + (mid << 16) % prime) % prime + low) % prime
+
+def _karatsuba(a, b, prime):
+    if not len(a) or not len(b):
+        return np.zeros(0, dtype=a.dtype)
+    n = max(len(a), len(b))
+    if min(len(a), len(b)) <= SCHOOLBOOK_THRESHOLD:
+        return _schoolbook(a, b, prime)
+    if len(a) > 2 * len(b) or len(b) > 2 * len(a):
+        # unbalanced: multiply the longer factor piece by piece
+        if len(a) < len(b):
+            a, b = b, a
+        result = np.zeros(len(a) + len(b) - 1, dtype=a.dtype)
+        for start in range(0, len(a), len(b)):
+            part = _karatsuba(a[start:start + len(b)], b, prime)
+            result[start:start + len(part)] = (result[start:start + len(part)] + part) % prime
+        return result
+    h = n // 2
+    a0, a1 = a[:h], a[h:]
+    b0, b1 = b[:h], b[h:]
+    z0 = _karatsuba(a0, b0, prime)
+    z2 = _karatsuba(a1, b1, prime)
+    z1 = _karatsuba(_poly_add_arrays(a0, a1, prime), _poly_add_arrays(b0, b1, prime), prime)
+    z1 = _poly_sub_arrays(_poly_sub_arrays(z1, z0, prime), z2, prime)
+    result = np.zeros(len(a) + len(b) - 1, dtype=a.dtype)
+    result[:len(z0)] = z0
+    result[2 * h:2 * h + len(z2)] = (result[2 * h:2 * h + len(z2)] + z2) % prime
+    result[h:h + len(z1)] = (result[h:h + len(z1)] + z1) % prime
+    return result
+
+def _poly_add_arrays(a, b, prime):
+    if len(a) < len(b):
+        a, b = b, a
+    result = a.copy()
+    result[:len(b)] = (result[:len(b)] + b) % prime
+    return result
+
+def _poly_sub_arrays(a, b, prime):
+    n = max(len(a), len(b))
+    result = np.zeros(n, dtype=a.dtype)
+    result[:len(a)] = a
+    result[:len(b)] = (result[:len(b)] - b) % prime
+    return result
+
+def _convolve(a, b, prime):
+    """Product of two coefficient arrays: NTT when GF(prime) has the roots of unity, else Karatsuba"""
+    if not len(a) or not len(b):
+        return np.zeros(0, dtype=a.dtype)
+    n = len(a) + len(b) - 1
+    if min(len(a), len(b)) <= SCHOOLBOOK_THRESHOLD:
+        return _schoolbook(a, b, prime)
+    size = 1 << (n - 1).bit_length()
+    if prime < _INT64_SPLIT and size <= _two_adic(prime):
+        fa = _ntt(np.concatenate([a, np.zeros(size - len(a), dtype=np.int64)]), prime)
+        fb = _ntt(np.concatenate([b, np.zeros(size - len(b), dtype=np.int64)]), prime)
+        return _ntt(_mulmod(fa, fb, prime), prime, invert=True)[:n]
+    return _karatsuba(a, b, prime)
+
+def _trim(a):
+    nonzero = np.flatnonzero(a)
+    return a[:nonzero[-1] + 1] if len(nonzero) else a[:0]
+
+def _inverse_series(f, n, prime):
+    """g with f * g = 1 mod x^n by Newton iteration g <- g (2 - f g); needs f[0] != 0"""
+    g = np.array([pow(int(f[0]), prime - 2, prime)], dtype=f.dtype)
+    k = 1
+    while k < n:
+        k = min(2 * k, n)
+        t = (-_convolve(f[:k], g, prime)[:k]) % prime
+        t[0] = (t[0] + 2) % prime
+        g = _convolve(g, t, prime)[:k]
+    return g
+
+def _poly_divmod_arrays(a, b, prime):
+    """Quotient and remainder of trimmed coefficient arrays a and b != 0"""
+    n, m = len(a), len(b)
+    if n < m:
+        return a[:0], a
+    k = n - m + 1
+    if k <= NEWTON_THRESHOLD:
+        lead_inverse = pow(int(b[-1]), prime - 2, prime)
+        r = a.copy()
+        q = np.zeros(k, dtype=a.dtype)
+        for i in range(k - 1, -1, -1):
+            c = int(r[i + m - 1]) * lead_inverse % prime
+            q[i] = c
+            if c:
+                r[i:i + m] = (r[i:i + m] - _mulmod(b, c, prime)) % prime
+        return q, _trim(r[:m - 1])
+    # rev(q) = rev(a) / rev(b) mod x^k
+    inverse = _inverse_series(b[::-1].copy(), k, prime)
+    q = _convolve(a[::-1][:k].copy(), inverse, prime)[:k][::-1].copy()
+    r = _poly_sub_arrays(a[:m - 1], _convolve(b, q, prime)[:m - 1], prime)
+    return q, _trim(r)
+
+def _horner(coeffs, points, prime):
+    """Evaluate one short polynomial at many points (coeffs broadcast against points)"""
+    result = np.zeros(np.shape(points), dtype=points.dtype)
+    for c in coeffs[::-1]:
+        result = (_mulmod(result, points, prime) + c) % prime
+    return result
+
+def _product_tree(points, prime):
+    """Subproduct tree over blocks of EVAL_BLOCK points; tree[0] holds the block polynomials"""
+    blocks = -(-len(points) // EVAL_BLOCK)
+    padded = np.zeros(blocks * EVAL_BLOCK, dtype=points.dtype)
+    padded[:len(points)] = points
+    padded = padded.reshape(blocks, EVAL_BLOCK)
+    # all block polynomials prod (x - x_i) at once, one root per step
+    leaf = np.ones((blocks, 1), dtype=points.dtype)
+    for j in range(EVAL_BLOCK):
+        grown = np.zeros((blocks, leaf.shape[1] + 1), dtype=points.dtype)
+        grown[:, 1:] = leaf
+        grown[:, :-1] = (grown[:, :-1] - _mulmod(leaf, padded[:, j:j + 1], prime)) % prime
+        leaf = grown
+    tree = [list(leaf)]
+    while len(tree[-1]) > 1:
+        level = tree[-1]
+        tree.append([_convolve(level[i], level[i + 1], prime) if i + 1 < len(level) else level[i]
+                     for i in range(0, len(level), 2)])
+    return tree, padded
+
+def _evaluate(coeffs, points, prime):
+    """Multipoint evaluation: Horner for short inputs, remainders down a subproduct tree otherwise"""
+    if not len(coeffs):
+        return np.zeros(len(points), dtype=points.dtype)
+    if len(coeffs) <= EVAL_BLOCK:
+        return _horner(coeffs, points, prime)
+    if len(points) <= EVAL_BLOCK:
+        return np.array([_summod(np.asarray(_mulmod(coeffs, _power_table(int(x), len(coeffs), prime), prime)), prime)
+                         for x in points], dtype=points.dtype)
+    tree, padded = _product_tree(points, prime)
+    remainders = [_poly_divmod_arrays(coeffs, tree[-1][0], prime)[1]]
+    for level in reversed(tree[:-1]):
+        remainders = [_poly_divmod_arrays(remainders[i // 2], node, prime)[1] for i, node in enumerate(level)]
+    # every remainder now has degree < EVAL_BLOCK: finish with one batched Horner
+    rows = np.zeros((len(remainders), EVAL_BLOCK), dtype=points.dtype)
+    for i, r in enumerate(remainders):
+        rows[i, :len(r)] = r
+    result = np.zeros(padded.shape, dtype=points.dtype)
+    for j in range(EVAL_BLOCK - 1, -1, -1):
+        result = (_mulmod(result, padded, prime) + rows[:, j:j + 1]) % prime
+    return result.reshape(-1)[:len(points)]
+
+class GFPolynomial:
+    """Polynomial over GF(p) with coefficients in a NumPy array, lowest degree first"""
+    
+    def __init__(self, field, coeffs):
+        self.field = field
+        if isinstance(coeffs, GFArray):
+            coeffs = coeffs.data
+        self.coeffs = _trim(np.atleast_1d(_to_residues(coeffs, field.prime)).reshape(-1))
+    
+    @classmethod
+    def _wrap(cls, field, coeffs):
+        poly = cls.__new__(cls)
+        poly.field = field
+        poly.coeffs = _trim(coeffs)
+        return poly
+    
+    @classmethod
+    def from_roots(cls, field, roots):
+        """prod (x - r) over the given roots"""
+        roots = GFArray(field, roots).data.reshape(-1)
+        if not len(roots):
+            return cls(field, [1])
+        tree, _ = _product_tree(roots, field.prime)
+        coeffs = tree[-1][0]
+        # the padding roots are 0: divide out x^(padding)
+        return cls._wrap(field, coeffs[len(coeffs) - 1 - len(roots):])
+    
+    @property
+    def degree(self):
+        """Degree, -1 for the zero polynomial"""
+        return len(self.coeffs) - 1
+    
+    def __repr__(self):
+        return f"GFPolynomial(GF({self.field.prime}), {self.coeffs.tolist()})"
+    
+    def _coerce(self, other):
+        if isinstance(other, GFPolynomial):
+            return other.coeffs
+        return GFPolynomial(self.field, [getattr(other, 'value', other)]).coeffs
+    
+    def __eq__(self, other):
+        return np.array_equal(self.coeffs, self._coerce(other))
+    
+    def __add__(self, other):
+        return GFPolynomial._wrap(self.field, _poly_add_arrays(self.coeffs, self._coerce(other), self.field.prime))
+    
+    def __radd__(self, other):
+        return self + other
+    
+    def __sub__(self, other):
+        return GFPolynomial._wrap(self.field, _poly_sub_arrays(self.coeffs, self._coerce(other), self.field.prime))
+    
+    def __rsub__(self, other):
+        return -self + other
+    
+    def __neg__(self):
+        return GFPolynomial._wrap(self.field, (-self.coeffs) % self.field.prime)
+    
+    def __mul__(self, other):
+        return GFPolynomial._wrap(self.field, _convolve(self.coeffs, self._coerce(other), self.field.prime))
+    
+    def __rmul__(self, other):
+        return self * other
+    
+    def __divmod__(self, other):
+        divisor = self._coerce(other)
+        if not len(divisor):
+            raise ZeroDivisionError("Polynomial division by zero")
+        q, r = _poly_divmod_arrays(self.coeffs, divisor, self.field.prime)
+        return GFPolynomial._wrap(self.field, q), GFPolynomial._wrap(self.field, r)
+    
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+    
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+    
+    def inverse_series(self, n):
+        """Power series g with self * g = 1 mod x^n"""
+        if not len(self.coeffs) or self.coeffs[0] == 0:
+            raise ValueError("Only series with a non-zero constant term are invertible")
+        return GFPolynomial._wrap(self.field, _inverse_series(self.coeffs, n, self.field.prime))
+    
+    def evaluate(self, points):
+        """Values at many points as a GFArray"""
+        points = GFArray(self.field, points)
+        values = _evaluate(self.coeffs, points.data.reshape(-1), self.field.prime)
+        return GFArray._wrap(self.field, values.reshape(points.shape))
+    
+    def __call__(self, x):
+        if isinstance(x, (int, FiniteFieldElement, FiniteFieldNumber)):
+            return self.evaluate([x])[0]
+        return self.evaluate(x)
+
+# ==================== LINEAR ALGEBRA OVER GF(p) ====================
+PANEL_WIDTH = 64  # columns eliminated per blocked Gauss-Jordan step
+_FLOAT_EXACT = 1 << 53  # integers below this are exact in float64
+
+def _matmul_mod(a, b, prime):
+    """a @ b mod prime using float64 BLAS on limbs small enough to keep every sum exact"""
+    if a.dtype == object or b.dtype == object:
+        return a.astype(object).dot(b.astype(object)) % prime
+    k = a.shape[1]
+    result = np.zeros((a.shape[0], b.shape[1]), dtype=np.int64)
+    if k == 0:
+        return result
+    room = 53 - k.bit_length()  # k * x * y < 2^53 whenever x * y < 2^room
+    bits = (prime - 1).bit_length()
+    shift = bits if 2 * bits <= room else room // 2
+    mask = (1 << shift) - 1
+    if shift == bits:
+        return (a.astype(np.float64) @ b.astype(np.float64)).astype(np.int64) % prime
+    a_limbs = [((a >> s) & mask).astype(np.float64) for s in range(0, bits, shift)]
+    b_limbs = [((b >> s) & mask).astype(np.float64) for s in range(0, bits, shift)]
+    for i, a_limb in enumerate(a_limbs):
+        for j, b_limb in enumerate(b_limbs):
+            partial = (a_limb @ b_limb).astype(np.int64) % prime
+            result += _mulmod(partial, pow(2, shift * (i + j), prime), prime)
+            result %= prime
+    return result
+
+def _eliminate_panel(panel, prime, lazy=False):
+    """Choose pivots of a panel by forward elimination; returns (row swaps, pivot columns)
+
+    With lazy=True the panel is worked on in float64 and only the column being
+    searched and the pivot row are reduced; the caller guarantees that the
+    unreduced entries stay exact.
+    """
+    panel = panel.astype(np.float64) if lazy else panel.copy()
+    swaps, pivots = [], []
+    r = 0
+    for j in range(panel.shape[1]):
+        if r == panel.shape[0]:
+            break
+        if lazy:
+            panel[r:, j] = np.remainder(panel[r:, j], prime)
+        nonzero = np.flatnonzero(panel[r:, j])
+        if not len(nonzero):
+            continue
+        i = r + nonzero[0]
+        if i != r:
+            panel[[r, i]] = panel[[i, r]]
+        swaps.append((r, i))
+        inverse = pow(int(panel[r, j]), prime - 2, prime)
+        if lazy:
+            row = np.remainder(np.remainder(panel[r, j:], prime) * inverse, prime)
+            panel[r, j:] = row
+            panel[r + 1:, j:] -= panel[r + 1:, j:j + 1] * row
+        else:
+            panel[r, j:] = _mulmod(panel[r, j:], inverse, prime)
+            below = panel[r + 1:, j:j + 1]
+            panel[r + 1:, j:] = (panel[r + 1:, j:] - _mulmod(below, panel[r, j:], prime)) % prime
+        pivots.append(j)
+        r += 1
+    return swaps, pivots
+
+def _small_inverse(b, prime):
+    """Inverse of a small non-singular matrix by unblocked Gauss-Jordan"""
+    k = len(b)
+    aug = np.concatenate([b, np.eye(k, dtype=b.dtype)], axis=1)
+    for j in range(k):
+        i = j + np.flatnonzero(aug[j:, j])[0]
+        if i != j:
+            aug[[j, i]] = aug[[i, j]]
+        aug[j] = _mulmod(aug[j], pow(int(aug[j, j]), prime - 2, prime), prime)
+        factors = aug[:, j:j + 1].copy()
+        factors[j] = 0
+        aug = (aug - _mulmod(factors, aug[j], prime)) % prime
+    return aug[:, k:]
+
+def _rref(a, prime):
+    """Reduced row echelon form and pivot columns by blocked Gauss-Jordan elimination"""
+    if prime == 2:
+        return _rref_gf2(a)
+    m, n = a.shape
+    # small primes: float64 storage, reduced only when entries could stop being exact
+    growth = PANEL_WIDTH * (prime - 1) ** 2
+    lazy = a.dtype != object and 4 * growth < _FLOAT_EXACT
+    work = a.astype(np.float64) if lazy else a.copy()
+    bound = prime
+    
+    def reduced(block):
+        return np.remainder(block, prime).astype(np.int64) if lazy else block.copy()
+    
+    pivots = []
+    r = c = 0
+    while r < m and c < n:
+        width = min(PANEL_WIDTH, n - c)
+        swaps, panel_pivots = _eliminate_panel(reduced(work[r:, c:c + width]), prime, lazy)
+        if panel_pivots:
+            for i, j in swaps:
+                if i != j:
+                    work[[r + i, r + j]] = work[[r + j, r + i]]
+            k = len(panel_pivots)
+            columns = [c + j for j in panel_pivots]
+            # scale the k pivot rows to identity on their pivot columns ...
+            inverse = _small_inverse(reduced(work[r:r + k][:, columns]), prime)
+            top = _matmul_mod(inverse, reduced(work[r:r + k, c:]), prime)
+            # ... and clear those columns from every other row with one matrix product
+            factors = reduced(work[:, columns])
+            factors[r:r + k] = 0
+            trailing = work[:, c:]
+            if lazy:
+                if bound + growth >= _FLOAT_EXACT:
+                    np.remainder(work, prime, out=work)
+                    bound = prime
+                trailing -= factors.astype(np.float64) @ top.astype(np.float64)
+                bound += growth
+            else:
+                trailing -= _matmul_mod(factors, top, prime)
+                trailing %= prime
+            work[r:r + k, c:] = top
+            pivots.extend(columns)
+            r += k
+        c += width
+    return reduced(work).astype(a.dtype), pivots
+
+def _rref_gf2(a):
+    """Gauss-Jordan over GF(2) on rows bit-packed into uint64 words (one XOR per 64 entries)"""
+    m, n = a.shape
+    words = -(-n // 64)
+    packed = np.zeros((m, words * 8), dtype=np.uint8)
+    packed[:, :-(-n // 8)] = np.packbits(a.astype(np.uint8), axis=1, bitorder='little')
+    bits = packed.view(np.uint64)
+    pivots = []
+    r = 0
+    for c in range(n):
+        if r == m:
+            break
+        w, bit = divmod(c, 64)
+        column = (bits[:, w] >> np.uint64(bit)) & np.uint64(1)
+        candidates = np.flatnonzero(column[r:])
+        if not len(candidates):
+            continue
+        i = r + candidates[0]
+        if i != r:
+            bits[[r, i]] = bits[[i, r]]
+            column[[r, i]] = column[[i, r]]
+        rows = np.flatnonzero(column)
+        rows = rows[rows != r]
+        bits[rows, w:] ^= bits[r, w:]
+        pivots.append(c)
+        r += 1
+    unpacked = np.unpackbits(bits.view(np.uint8), axis=1, bitorder='little')[:, :n]
+    return unpacked.astype(a.dtype), pivots
+
+class GFMatrix:
+    """Matrix over GF(p) backed by a 2-D NumPy array (int64 for p < 2^62, Python ints above)"""
+    
+    def __init__(self, field, rows):
+        self.field = field
+        if isinstance(rows, (GFMatrix, GFArray)):
+            rows = rows.data
+        self.data = np.atleast_2d(_to_residues(rows, field.prime))
+    
+    @classmethod
+    def _wrap(cls, field, data):
+        matrix = cls.__new__(cls)
+        matrix.field = field
+        matrix.data = data
+        return matrix
+    
+    @classmethod
+    def identity(cls, field, n):
+        dtype = object if field.prime >= _INT64_SPLIT else np.int64
+        return cls._wrap(field, np.eye(n, dtype=dtype))
+    
+    @classmethod
+    def random(cls, field, shape):
+        """Uniformly random matrix of the given shape"""
+        return cls._wrap(field, GFArray.random(field, shape).data)
+    
+    @property
+    def shape(self):
+        return self.data.shape
+    
+    @property
+    def T(self):
+        return GFMatrix._wrap(self.field, self.data.T.copy())
+    
+    def __repr__(self):
+        return f"GFMatrix(GF({self.field.prime}), {self.data.tolist()})"
+    
+    def __eq__(self, other):
+        other = other.data if isinstance(other, GFMatrix) else other
+        return np.array_equal(self.data, other)
+    
+    def __add__(self, other):
+        return GFMatrix._wrap(self.field, (self.data + GFMatrix(self.field, other).data) % self.field.prime)
+    
+    def __sub__(self, other):
+        return GFMatrix._wrap(self.field, (self.data - GFMatrix(self.field, other).data) % self.field.prime)
+    
+    def __matmul__(self, other):
+        vector = isinstance(other, GFArray) and other.data.ndim == 1
+        other = GFMatrix(self.field, other).data
+        if vector:
+            product = _matmul_mod(self.data, other.reshape(-1, 1), self.field.prime)
+            return GFArray._wrap(self.field, product.reshape(-1))
+        return GFMatrix._wrap(self.field, _matmul_mod(self.data, other, self.field.prime))
+    
+    def rref(self):
+        """Reduced row echelon form and the tuple of pivot columns"""
+        reduced, pivots = _rref(self.data, self.field.prime)
+        return GFMatrix._wrap(self.field, reduced), tuple(pivots)
+    
+    def rank(self):
+        return len(self.rref()[1])
+    
+    def nullspace(self):
+        """Matrix whose rows are a basis of {x : self @ x = 0}"""
+        reduced, pivots = _rref(self.data, self.field.prime)
+        n = self.shape[1]
+        free = [j for j in range(n) if j not in set(pivots)]
+        basis = np.zeros((len(free), n), dtype=self.data.dtype)
+        basis[np.arange(len(free)), free] = 1
+        if pivots:
+            basis[:, pivots] = (-reduced[:len(pivots)][:, free].T) % self.field.prime
+        return GFMatrix._wrap(self.field, basis)
+    
+    def inverse(self):
+        n, m = self.shape
+        if n != m:
+            raise ValueError("Only square matrices have inverses")
+        identity = np.eye(n, dtype=self.data.dtype)
+        reduced, pivots = _rref(np.concatenate([self.data, identity], axis=1), self.field.prime)
+        if len(pivots) < n or pivots[n - 1] != n - 1:
+            raise ValueError("Matrix is singular")
+        return GFMatrix._wrap(self.field, reduced[:, n:])
+    
+    def solve(self, b):
+        """One solution x of self @ x = b (free variables set to 0); b is a vector or a matrix"""
+        vector = not isinstance(b, GFMatrix) and np.ndim(b.data if isinstance(b, GFArray) else b) == 1
+        rhs = GFMatrix(self.field, b).data
+        if vector:
+            rhs = rhs.reshape(-1, 1)
+        n = self.shape[1]
+        reduced, pivots = _rref(np.concatenate([self.data, rhs], axis=1), self.field.prime)
+        if pivots and pivots[-1] >= n:
+            raise ValueError("System has no solution")
+        x = np.zeros((n, rhs.shape[1]), dtype=self.data.dtype)
+        x[pivots] = reduced[:len(pivots), n:]
+        if vector:
+            return GFArray._wrap(self.field, x.reshape(-1))
+        return GFMatrix._wrap(self.field, x)
+
+# ==================== EXTENSION FIELDS GF(p^k) ====================
+# Elements of GF(p^k) are polynomials of degree < k over GF(p), encoded as
+# the integer whose base-p digits are the coefficients (lowest first), so
+# for p = 2 the bits of a byte are the coefficients of an element of GF(2^8).
+DEFAULT_MODULI = {
+    (2, 8): 0x11d,     # x^8 + x^4 + x^3 + x^2 + 1, the Reed-Solomon standard
+    (2, 16): 0x1100b,  # x^16 + x^12 + x^3 + x + 1
+}
+EXTENSION_TABLE_BOUND = 1 << 16  # ExtensionField uses log/exp tables up to this order
+FULL_MUL_TABLE_BOUND = 1 << 8    # and a full product table up to this one
+
+def _int_to_poly(value, prime):
+    coeffs = []
+    while value:
+        value, c = divmod(value, prime)
+        coeffs.append(c)
+    return coeffs
+
+def _poly_to_int(coeffs, prime):
+    value = 0
+    for c in reversed(coeffs):
+        value = value * prime + c
+    return value
+
+def _poly_trim(coeffs):
+    while coeffs and coeffs[-1] == 0:
+        coeffs.pop()
+    return coeffs
+
+def _poly_sub(a, b, prime):
+    n = max(len(a), len(b))
+    a = a + [0] * (n - len(a))
+    b = b + [0] * (n - len(b))
+    return _poly_trim([(x - y) % prime for x, y in zip(a, b)])
+
+def _poly_divmod(a, b, prime):
+    """Quotient and remainder over GF(prime); coefficient lists, lowest first"""
+    a = list(a)
+    degree = len(b) - 1
+    lead_inverse = pow(b[-1], prime - 2, prime)
+    quotient = [0] * max(len(a) - degree, 0)
+    for i in range(len(a) - 1 - degree, -1, -1):
+        coef = a[i + degree] * lead_inverse % prime
+        quotient[i] = coef
+        if coef:
+            for j, bj in enumerate(b):
+                a[i + j] = (a[i + j] - coef * bj) % prime
+    return _poly_trim(quotient), _poly_trim(a[:degree])
+
+def _poly_mulmod(a, b, f, prime):
+    if not a or not b:
+        return []
+    product = [0] * (len(a) + len(b) - 1)
+    for i, ai in enumerate(a):
+        if ai:
+            for j, bj in enumerate(b):
+                product[i + j] = (product[i + j] + ai * bj) % prime
+    return _poly_divmod(product, f, prime)[1]
+
+def _poly_powmod(base, exponent, f, prime):
+    result = [1]
+    base = _poly_divmod(base, f, prime)[1]
+    while exponent:
+        if exponent & 1:
+            result = _poly_mulmod(result, base, f, prime)
+        base = _poly_mulmod(base, base, f, prime)
+        exponent >>= 1
+    return result
+
+def _poly_gcd(a, b, prime):
+    while b:
+        a, b = b, _poly_divmod(a, b, prime)[1]
+    return a
+
+def _gf2_mulmod(a, b, modulus, degree):
+    """Carry-less a * b reduced by modulus, for GF(2^degree)"""
+    result = 0
+    top = 1 << degree
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if a & top:
+            a ^= modulus
+    return result
+
+def is_irreducible(modulus, prime):
+    """Rabin's test for the polynomial encoded by modulus over GF(prime)"""
+    f = _int_to_poly(modulus, prime)
+    degree = len(f) - 1
+    if degree < 1 or f[0] == 0 and degree > 1:
+        return degree == 1
+    x = [0, 1]
+    # no factor of degree k/q for any prime q | k ...
+    for q in _prime_factors(degree):
+        h = _poly_powmod(x, prime ** (degree // q), f, prime)
+        if len(_poly_gcd(f, _poly_sub(h, x, prime), prime)) != 1:
+            return False
+    # ... and f divides x^(p^k) - x
+    return not _poly_sub(_poly_powmod(x, prime ** degree, f, prime), x, prime)
+
+def _default_modulus(prime, degree):
+    """DEFAULT_MODULI entry, else the smallest monic irreducible of the degree"""
+    modulus = DEFAULT_MODULI.get((prime, degree))
+    if modulus is not None:
+        return modulus
+    for modulus in range(prime ** degree + 1, 2 * prime ** degree):
+        if modulus % prime and is_irreducible(modulus, prime):
+            return modulus
+    raise ValueError(f"No irreducible polynomial of degree {degree} over GF({prime})")
+
+class ExtensionDescriptor:
+    """Shared description of GF(p^k) for one modulus; compared by identity"""
+    __slots__ = ('prime', 'degree', 'modulus', 'order', 'tables', '_poly')
+    
+    def __init__(self, prime, degree, modulus):
+        self.prime = prime
+        self.degree = degree
+        self.modulus = modulus
+        self.order = prime ** degree
+        self.tables = None  # ExtensionTables, built on first request
+        self._poly = _int_to_poly(modulus, prime)
+    
+    def __repr__(self):
+        return f"ExtensionDescriptor({self.prime}, {self.degree}, {self.modulus:#x})"
+    
+    def __reduce__(self):
+        return (extension_descriptor, (self.prime, self.degree, self.modulus))
+    
+    def add(self, a, b):
+        """Sum of two encoded elements (digit-wise mod p; XOR for p = 2)"""
+        p = self.prime
+        if p == 2:
+            return a ^ b
+        result, scale = 0, 1
+        while a or b:
+            a, da = divmod(a, p)
+            b, db = divmod(b, p)
+            result += (da + db) % p * scale
+            scale *= p
+        return result
+    
+    def negate(self, a):
+        p = self.prime
+        if p == 2:
+            return a
+        result, scale = 0, 1
+        while a:
+            a, d = divmod(a, p)
+            result += (-d) % p * scale
+            scale *= p
+        return result
+    
+    def multiply(self, a, b):
+        """Product of two encoded elements modulo the field polynomial"""
+        if self.prime == 2:
+            return _gf2_mulmod(a, b, self.modulus, self.degree)
+        p = self.prime
+        return _poly_to_int(_poly_mulmod(_int_to_poly(a, p), _int_to_poly(b, p), self._poly, p), p)
+    
+    def power(self, a, exponent):
+        result = 1
+        while exponent:
+            if exponent & 1:
+                result = self.multiply(result, a)
+            a = self.multiply(a, a)
+            exponent >>= 1
+        return result
+
+_EXTENSION_REGISTRY = {}
+
+def extension_descriptor(prime, degree, modulus=None):
+    """Return the interned descriptor of GF(prime^degree), validating the modulus once"""
+    if modulus is None:
+        key = (prime, degree, None)
+        descriptor = _EXTENSION_REGISTRY.get(key)
+        if descriptor is None:
+            field_descriptor(prime)  # validates prime
+            descriptor = extension_descriptor(prime, degree, _default_modulus(prime, degree))
+            _EXTENSION_REGISTRY[key] = descriptor
+        return descriptor
+    key = (prime, degree, modulus)
+    descriptor = _EXTENSION_REGISTRY.get(key)
+    if descriptor is None:
+        field_descriptor(prime)
+        if not prime ** degree <= modulus < 2 * prime ** degree:
+            raise ValueError(f"Modulus {modulus:#x} is not a monic polynomial of degree {degree}")
+        if not is_irreducible(modulus, prime):
+            raise ValueError(f"Modulus {modulus:#x} is reducible over GF({prime})")
+        descriptor = _EXTENSION_REGISTRY.setdefault(key, ExtensionDescriptor(prime, degree, modulus))
+    return descriptor
+
+class ExtensionTables:
+    """exp/log/inverse tables of GF(p^k), plus the full product table for small orders"""
+    __slots__ = ('generator', 'exp', 'log', 'inv', 'exp_array', 'log_array', 'inv_array', 'mul')
+    
+    def __init__(self, descriptor):
+        order = descriptor.order - 1
+        self.generator = g = self._find_generator(descriptor)
+        exp = [1] * (2 * order)
+        for i in range(1, 2 * order):
+            exp[i] = descriptor.multiply(exp[i - 1], g)
+        log = [0] * descriptor.order
+        for i in range(order):
+            log[exp[i]] = i
+        inv = [0] * descriptor.order
+        for v in range(1, descriptor.order):
+            inv[v] = exp[order - log[v]]
+        self.exp, self.log, self.inv = exp, log, inv
+        self.exp_array = np.array(exp, dtype=np.int64)
+        self.log_array = np.array(log, dtype=np.int64)
+        self.inv_array = np.array(inv, dtype=np.int64)
+        self.mul = None
+        if descriptor.order <= FULL_MUL_TABLE_BOUND:
+            # mul[a, b] = a * b, so a scalar times a buffer is one gather
+            dtype = np.uint8 if descriptor.order <= 256 else np.int64
+            mul = self.exp_array[self.log_array[:, None] + self.log_array[None, :]].astype(dtype)
+            mul[0, :] = 0
+            mul[:, 0] = 0
+            self.mul = mul
+    
+    @staticmethod
+    def _find_generator(descriptor):
+        order = descriptor.order - 1
+        factors = _prime_factors(order)
+        for g in range(2, descriptor.order):
+            if all(descriptor.power(g, order // q) != 1 for q in factors):
+                return g
+        return 1  # GF(2)
+
+def extension_tables(descriptor):
+    """Tables of an extension field, built once and cached on its descriptor"""
+    if descriptor.tables is None:
+        descriptor.tables = ExtensionTables(descriptor)
+    return descriptor.tables
+
+class ExtensionFieldElement:
+    """Represents an element of an extension field GF(p^k)"""
+    
+    def __init__(self, value, field):
+        if not 0 <= value < field.order:
+            raise ValueError(f"{value} does not encode an element of GF({field.prime}^{field.degree})")
+        self.value = value
+        self.field = field
+    
+    def __eq__(self, other):
+        if isinstance(other, ExtensionFieldElement):
+            return self.field is other.field and self.value == other.value
+        return self.value == other
+    
+    def __repr__(self):
+        return f"GF({self.field.prime}^{self.field.degree})({self.value})"
+    
+    def __str__(self):
+        return str(self.value)
+
+class ExtensionAddGroup(Group):
+    """Additive group of GF(p^k)"""
+    
+    def __init__(self, descriptor):
+        self._field = descriptor
+        self._identity = ExtensionFieldElement(0, descriptor)
+    
+    @property
+    def identity(self):
+        return self._identity
+    
+    def operation(self, a, b):
+        if not (self.include(a) and self.include(b)):
+            raise TypeError("Elements must be from this field")
+        return ExtensionFieldElement(self._field.add(a.value, b.value), self._field)
+    
+    def inverse(self, a):
+        if not self.include(a):
+            raise TypeError("Element must be from this field")
+        return ExtensionFieldElement(self._field.negate(a.value), self._field)
+    
+    def include(self, element):
+        return (isinstance(element, ExtensionFieldElement) and 
+                element.field is self._field)
+    
+    @property
+    def order(self):
+        return self._field.order
+    
+    def element_at(self, index):
+        if not 0 <= index < self._field.order:
+            raise IndexError("Group element index out of range")
+        return ExtensionFieldElement(index, self._field)
+    
+    def _get_all_elements(self):
+        return [ExtensionFieldElement(i, self._field) for i in range(self._field.order)]
+
+class ExtensionMulGroup(Group):
+    """Multiplicative group of GF(p^k) (excluding 0)"""
+    
+    def __init__(self, descriptor, tables=None):
+        self._field = descriptor
+        self._identity = ExtensionFieldElement(1, descriptor)
+        self._tables = tables
+    
+    @property
+    def identity(self):
+        return self._identity
+    
+    def operation(self, a, b):
+        if not (self.include(a) and self.include(b)):
+            raise TypeError("Elements must be from this field and non-zero")
+        if self._tables is not None:
+            tables = self._tables
+            return ExtensionFieldElement(tables.exp[tables.log[a.value] + tables.log[b.value]], self._field)
+        return ExtensionFieldElement(self._field.multiply(a.value, b.value), self._field)
+    
+    def inverse(self, a):
+        if not self.include(a):
+            raise TypeError("Element must be from this field and non-zero")
+        if self._tables is not None:
+            return ExtensionFieldElement(self._tables.inv[a.value], self._field)
+        # a^(q-2) is the inverse of a in a field of order q
+        return ExtensionFieldElement(self._field.power(a.value, self._field.order - 2), self._field)
+    
+    def include(self, element):
+        return (isinstance(element, ExtensionFieldElement) and 
+                element.field is self._field and 
+                element.value != 0)
+    
+    @property
+    def order(self):
+        return self._field.order - 1
+    
+    def element_at(self, index):
+        if not 0 <= index < self._field.order - 1:
+            raise IndexError("Group element index out of range")
+        return ExtensionFieldElement(index + 1, self._field)
+    
+    def _get_all_elements(self):
+        return [ExtensionFieldElement(i, self._field) for i in range(1, self._field.order)]
+
+class ExtensionField:
+    """Extension field GF(p^k) = GF(p)[x] / (modulus)"""
+    
+    def __init__(self, prime, degree, modulus=None, use_tables=None):
+        self.descriptor = extension_descriptor(prime, degree, modulus)
+        self.prime = prime
+        self.degree = degree
+        self.modulus = self.descriptor.modulus
+        self.order = self.descriptor.order
+        if use_tables is None:
+            use_tables = self.order <= EXTENSION_TABLE_BOUND
+        self.tables = extension_tables(self.descriptor) if use_tables else None
+        self.add_group = ExtensionAddGroup(self.descriptor)
+        self.mul_group = ExtensionMulGroup(self.descriptor, self.tables)
+        # byte buffers hold one symbol per byte in GF(2^8), per little-endian word in GF(2^16)
+        self._symbol_dtype = None
+        if prime == 2 and degree in (8, 16) and self.tables is not None:
+            self._symbol_dtype = np.dtype(np.uint8) if degree == 8 else np.dtype('<u2')
+    
+    def __repr__(self):
+        return f"GF({self.prime}^{self.degree})"
+    
+    def element(self, value):
+        """Create an element from its integer encoding"""
+        return ExtensionFieldElement(value, self.descriptor)
+    
+    def random_element(self):
+        """Generate a random element"""
+        return self.add_group.random_generate()
+    
+    def random_nonzero_element(self):
+        """Generate a random non-zero element"""
+        return self.mul_group.random_generate()
+    
+    def _symbols(self, buffer):
+        if self._symbol_dtype is None:
+            raise ValueError(f"Byte-buffer operations need GF(2^8) or GF(2^16) with tables, not {self}")
+        return np.frombuffer(buffer, dtype=self._symbol_dtype)
+    
+    def _scalar_row(self, scalar):
+        """scalar * v for every symbol v"""
+        tables = self.tables
+        if tables.mul is not None:
+            return tables.mul[scalar]
+        if scalar == 0:
+            return np.zeros(self.order, dtype=self._symbol_dtype)
+        row = tables.exp_array[tables.log_array + tables.log[scalar]].astype(self._symbol_dtype)
+        row[0] = 0
+        return row
+    
+    def buffer_mul(self, scalar, src, out=None):
+        """out = scalar * src symbol by symbol; returns out (a new bytearray by default)"""
+        scalar = getattr(scalar, 'value', scalar)
+        symbols = self._symbols(src)
+        if out is None:
+            out = bytearray(len(src))
+        target = self._symbols(out)
+        if len(target) != len(symbols):
+            raise ValueError("Buffers must have the same length")
+        np.take(self._scalar_row(scalar), symbols, out=target)
+        return out
+    
+    def buffer_addmul(self, dst, scalar, src):
+        """dst += scalar * src symbol by symbol, in place (dst must be writable)"""
+        scalar = getattr(scalar, 'value', scalar)
+        symbols = self._symbols(src)
+        target = self._symbols(dst)
+        if len(target) != len(symbols):
+            raise ValueError("Buffers must have the same length")
+        if scalar == 1:
+            np.bitwise_xor(target, symbols, out=target)
+        elif scalar:
+            np.bitwise_xor(target, self._scalar_row(scalar)[symbols], out=target)
+        return dst
+
+# ==================== ELLIPTIC CURVES ====================
+CURVE_COUNT_BOUND = 1 << 20  # curves over smaller primes count their points if no order is given
+
+def sqrt_mod(a, prime):
+    """Square root of a modulo prime (Tonelli-Shanks), or None if a is not a square"""
+    a %= prime
+    if a == 0 or prime == 2:
+        return a
+    if pow(a, (prime - 1) // 2, prime) != 1:
+        return None
+    if prime % 4 == 3:
+        return pow(a, (prime + 1) // 4, prime)
+    q, s = prime - 1, 0
+    while q % 2 == 0:
+        q //= 2
+        s += 1
+    z = 2
+    while pow(z, (prime - 1) // 2, prime) != prime - 1:
+        z += 1
+    m, c, t, r = s, pow(z, q, prime), pow(a, q, prime), pow(a, (q + 1) // 2, prime)
+    while t != 1:
+        # least i with t^(2^i) == 1
+        i, t2 = 1, t * t % prime
+        while t2 != 1:
+            t2 = t2 * t2 % prime
+            i += 1
+        b = pow(c, 1 << (m - i - 1), prime)
+        m, c, t, r = i, b * b % prime, t * b * b % prime, r * b % prime
+    return r
+
+def _wnaf(k, width):
+    """Width-w non-adjacent form of k >= 0, least significant digit first"""
+    digits = []
+    while k:
+        if k & 1:
+            d = k & ((1 << width) - 1)
+            if d >= 1 << (width - 1):
+                d -= 1 << width
+            k -= d
+        else:
+            d = 0
+        digits.append(d)
+        k >>= 1
+    return digits
+
+class CurvePoint:
+    """Point of an EllipticCurve in Jacobian coordinates (X : Y : Z) = (X/Z^2, Y/Z^3); Z = 0 is infinity"""
+    __slots__ = ('curve', 'X', 'Y', 'Z')
+    
+    def __init__(self, curve, X, Y, Z=1):
+        self.curve = curve
+        self.X, self.Y, self.Z = X, Y, Z
+    
+    def affine(self):
+        """(x, y), or None for the point at infinity; rescales the point to Z = 1"""
+        if self.Z == 0:
+            return None
+        if self.Z != 1:
+            self.curve.normalize_batch([self])
+        return self.X, self.Y
+    
+    @property
+    def x(self):
+        return self.affine()[0]
+    
+    @property
+    def y(self):
+        return self.affine()[1]
+    
+    def __eq__(self, other):
+        if not isinstance(other, CurvePoint) or other.curve is not self.curve:
+            return False
+        if self.Z == 0 or other.Z == 0:
+            return self.Z == other.Z
+        p = self.curve.prime
+        z1, z2 = self.Z * self.Z % p, other.Z * other.Z % p
+        return (self.X * z2 % p == other.X * z1 % p and 
+                self.Y * z2 * other.Z % p == other.Y * z1 * self.Z % p)
+    
+    def __neg__(self):
+        return self.curve.inverse(self)
+    
+    def __add__(self, other):
+        return self.curve.operation(self, other)
+    
+    def __sub__(self, other):
+        return self.curve.operation(self, -other)
+    
+    def __rmul__(self, k):
+        return self.curve.multiply(self, k)
+    
+    def __repr__(self):
+        point = self.affine()
+        return "EC(O)" if point is None else f"EC({point[0]}, {point[1]})"
+
+class EllipticCurve(Group):
+    """Points of y^2 = x^3 + a*x + b over GF(p), p > 3, under point addition"""
+    
+    def __init__(self, field, a, b, order=None):
+        self.field = field if isinstance(field, FiniteField) else FiniteField(field)
+        p = self.prime = self.field.prime
+        if p <= 3:
+            raise ValueError("Short Weierstrass curves need p > 3")
+        self.a, self.b = a % p, b % p
+        if (4 * self.a ** 3 + 27 * self.b ** 2) % p == 0:
+            raise ValueError("Singular curve: 4a^3 + 27b^2 = 0")
+        self._order = order
+        self._identity = CurvePoint(self, 1, 1, 0)
+        self._combs = {}  # affine (x, y) -> FixedBaseComb
+    
+    def __repr__(self):
+        return f"EllipticCurve(y^2 = x^3 + {self.a}x + {self.b} over GF({self.prime}))"
+    
+    # ---------- Jacobian arithmetic on (X, Y, Z) tuples ----------
+    def _double(self, P):
+        X, Y, Z = P
+        p = self.prime
+        if Z == 0 or Y == 0:
+            return (1, 1, 0)
+        XX, YY = X * X % p, Y * Y % p
+        S = 4 * X * YY % p
+        M = 3 * XX
+        if self.a:
+            ZZ = Z * Z % p
+            M += self.a * ZZ * ZZ
+        M %= p
+        X3 = (M * M - 2 * S) % p
+        return X3, (M * (S - X3) - 8 * YY * YY) % p, 2 * Y * Z % p
+    
+    def _add(self, P, Q):
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+        if Z1 == 0:
+            return Q
+        if Z2 == 0:
+            return P
+        p = self.prime
+        Z1Z1 = Z1 * Z1 % p
+        U2, S2 = X2 * Z1Z1 % p, Y2 * Z1 * Z1Z1 % p
+        if Z2 == 1:  # mixed addition with an affine Q saves four multiplications
+            U1, S1 = X1, Y1
+        else:
+            Z2Z2 = Z2 * Z2 % p
+            U1, S1 = X1 * Z2Z2 % p, Y1 * Z2 * Z2Z2 % p
+        H, R = (U2 - U1) % p, (S2 - S1) % p
+        if H == 0:
+            return self._double(P) if R == 0 else (1, 1, 0)
+        HH = H * H % p
+        HHH, V = H * HH % p, U1 * HH % p
+        X3 = (R * R - HHH - 2 * V) % p
+        Z3 = Z1 * H % p if Z2 == 1 else Z1 * Z2 * H % p
+        return X3, (R * (V - X3) - S1 * HHH) % p, Z3
+    
+    def _normalize(self, triples):
+        """Rescale Jacobian triples to Z = 1 with one inversion (Montgomery's trick)"""
+        p = self.prime
+        pending = [i for i, T in enumerate(triples) if T[2] not in (0, 1)]
+        if not pending:
+            return list(triples)
+        inverses = self.field.mul_group.batch_inverse([self.field.element(triples[i][2]) for i in pending])
+        result = list(triples)
+        for i, inverse in zip(pending, inverses):
+            X, Y, _ = triples[i]
+            zi = inverse.value
+            zi2 = zi * zi % p
+            result[i] = (X * zi2 % p, Y * zi2 * zi % p, 1)
+        return result
+    
+    # ---------- Group interface ----------
+    @property
+    def identity(self):
+        return self._identity
+    
+    def operation(self, a, b):
+        if not (self.include(a) and self.include(b)):
+            raise TypeError("Points must be on this curve")
+        return CurvePoint(self, *self._add((a.X, a.Y, a.Z), (b.X, b.Y, b.Z)))
+    
+    def inverse(self, a):
+        if not self.include(a):
+            raise TypeError("Point must be on this curve")
+        return CurvePoint(self, a.X, (-a.Y) % self.prime, a.Z)
+    
+    def include(self, element):
+        if not (isinstance(element, CurvePoint) and element.curve is self):
+            return False
+        X, Y, Z = element.X, element.Y, element.Z
+        if Z == 0:
+            return True
+        p = self.prime
+        Z2 = Z * Z % p
+        Z4 = Z2 * Z2 % p
+        return (Y * Y - X * X * X - self.a * X * Z4 - self.b * Z4 * Z2) % p == 0
+    
+    @property
+    def order(self):
+        """Number of points, counted with Legendre symbols for small p unless given"""
+        if self._order is None:
+            if self.prime >= CURVE_COUNT_BOUND:
+                raise ValueError(f"Point count over GF({self.prime}) is too slow to compute; "
+                                 "pass order= to EllipticCurve")
+            p = self.prime
+            x = np.arange(p, dtype=np.int64)
+            rhs = (x * x % p * x + self.a * x + self.b) % p
+            chi = _powmod(rhs, (p - 1) // 2, p)
+            # chi is 1 for squares, p - 1 for non-squares, 0 for zero
+            self._order = int(p + 1 + np.count_nonzero(chi == 1) - np.count_nonzero(chi == p - 1))
+        return self._order
+    
+    def point(self, x, y):
+        """Affine point (x, y); raises ValueError if it is not on the curve"""
+        point = CurvePoint(self, x % self.prime, y % self.prime)
+        if not self.include(point):
+            raise ValueError(f"({x}, {y}) is not on {self}")
+        return point
+    
+    def lift_x(self, x, odd=False):
+        """Point with the given x coordinate (y chosen by parity), or None"""
+        p = self.prime
+        y = sqrt_mod(x * x * x + self.a * x + self.b, p)
+        if y is None:
+            return None
+        if y % 2 != odd:
+            y = (-y) % p
+        return CurvePoint(self, x % p, y)
+    
+    def random_generate(self):
+        while True:
+            point = self.lift_x(random.randrange(self.prime), random.getrandbits(1))
+            if point is not None:
+                return point
+    
+    def _get_all_elements(self):
+        points = [self._identity]
+        for x in range(self.prime):
+            point = self.lift_x(x)
+            if point is not None:
+                points.append(point)
+                if point.Y:
+                    points.append(-point)
+        return points
+    
+    # ---------- scalar multiplication ----------
+    def multiply(self, point, k):
+        """k * point, by a precomputed comb when one exists for point, else by wNAF"""
+        if not self.include(point):
+            raise TypeError("Point must be on this curve")
+        if self._order is not None:
+            k %= self._order
+        # combs are keyed by affine (x, y); a Jacobian point is not rescaled
+        # (or inverted) just to look for one
+        if self._combs and point.Z == 1:
+            comb = self._combs.get((point.X, point.Y))
+            if comb is not None:
+                return comb.multiply(k)
+        return self._wnaf_multiply(point, k)
+    
+    def _wnaf_multiply(self, point, k, width=None):
+        if k < 0:
+            point, k = -point, -k
+        if k == 0 or point.Z == 0:
+            return self._identity
+        if width is None:
+            width = 4 if k.bit_length() <= 160 else 5
+        P = (point.X, point.Y, point.Z)
+        # odd multiples P, 3P, ..., (2^(w-1) - 1)P, made affine for mixed additions
+        twice = self._double(P)
+        odd = [P]
+        for _ in range((1 << (width - 2)) - 1):
+            odd.append(self._add(odd[-1], twice))
+        odd = self._normalize(odd)
+        p = self.prime
+        R = (1, 1, 0)
+        for d in reversed(_wnaf(k, width)):
+            R = self._double(R)
+            if d > 0:
+                R = self._add(R, odd[d >> 1])
+            elif d < 0:
+                X, Y, Z = odd[(-d) >> 1]
+                R = self._add(R, (X, (-Y) % p, Z))
+        return CurvePoint(self, *R)
+    
+    def precompute(self, point, window=6):
+        """Build a fixed-base comb for point; later multiply(point, k) calls use it"""
+        comb = FixedBaseComb(self, point, window)
+        self._combs[point.affine()] = comb
+        return comb
+    
+    def normalize_batch(self, points):
+        """Rescale CurvePoints to affine coordinates in place with one field inversion"""
+        triples = self._normalize([(P.X, P.Y, P.Z) for P in points])
+        for P, (X, Y, Z) in zip(points, triples):
+            P.X, P.Y, P.Z = X, Y, Z
+        return points
+
+class FixedBaseComb:
+    """Lim-Lee comb for k * P with P fixed: d doublings and at most d additions for d = bits / window"""
+    
+    def __init__(self, curve, point, window=6, max_bits=None):
+        self.curve = curve
+        self.window = window
+        if max_bits is None:
+            max_bits = (curve._order or 2 * curve.prime).bit_length()
+        self.d = d = -(-max_bits // window)
+        # bases[j] = 2^(j*d) P
+        bases = [(point.X, point.Y, point.Z)]
+        for _ in range(window - 1):
+            B = bases[-1]
+            for _ in range(d):
+                B = curve._double(B)
+            bases.append(B)
+        # table[c] = sum of bases[j] over the set bits j of c
+        table = [(1, 1, 0)] * (1 << window)
+        for c in range(1, 1 << window):
+            low = c & -c
+            table[c] = curve._add(table[c ^ low], bases[low.bit_length() - 1])
+        self._table = curve._normalize(table)
+    
+    def multiply(self, k):
+        curve = self.curve
+        if k < 0:
+            return -self.multiply(-k)
+        if k.bit_length() > self.d * self.window:
+            point = CurvePoint(curve, *self._table[1])
+            return curve._wnaf_multiply(point, k)
+        d, table = self.d, self._table
+        columns = [(k >> (j * d)) & ((1 << d) - 1) for j in range(self.window)]
+        R = (1, 1, 0)
+        for i in range(d - 1, -1, -1):
+            R = curve._double(R)
+            c = 0
+            for j, column in enumerate(columns):
+                c |= ((column >> i) & 1) << j
+            if c:
+                R = curve._add(R, table[c])
+        return CurvePoint(curve, *R)
+
 # ==================== FIELD AXIOMS TESTING ====================
 def check_distributivity(f):
     """Check distributivity property - FIXED VERSION"""
@@ -377,10 +2386,10 @@ def check_distributivity(f):
 
         # Left distributivity: a * (b + c) = (a * b) + (a * c)
         b_plus_c = f.add_group.operation(b, c)
-        lhs = f.mul_group.operation(a, b_plus_c)
+        lhs = _field_mul(f, a, b_plus_c)
         
-        a_times_b = f.mul_group.operation(a, b)
-        a_times_c = f.mul_group.operation(a, c)
+        a_times_b = _field_mul(f, a, b)
+        a_times_c = _field_mul(f, a, c)
         rhs = f.add_group.operation(a_times_b, a_times_c)
         
         assert lhs == rhs, f"Left distributivity failed: {a} * ({b} + {c}) != ({a} * {b}) + ({a} * {c})"
@@ -389,10 +2398,10 @@ def check_distributivity(f):
         # For this case, 'c' must be non-zero, 'a' and 'b' can be zero
         c_nonzero = f.mul_group.random_generate()  # Non-zero for multiplication
         a_plus_b = f.add_group.operation(a, b)
-        lhs = f.mul_group.operation(a_plus_b, c_nonzero)
+        lhs = _field_mul(f, a_plus_b, c_nonzero)
         
-        a_times_c = f.mul_group.operation(a, c_nonzero)
-        b_times_c = f.mul_group.operation(b, c_nonzero)
+        a_times_c = _field_mul(f, a, c_nonzero)
+        b_times_c = _field_mul(f, b, c_nonzero)
         rhs = f.add_group.operation(a_times_c, b_times_c)
         
         assert lhs == rhs, f"Right distributivity failed: ({a} + {b}) * {c_nonzero} != ({a} * {c_nonzero}) + ({b} * {c_nonzero})"
@@ -416,6 +2425,174 @@ def check_field_axioms(f):
     
     print(f"\n✅ GF({f.prime}) satisfies all field axioms!")
 
+# ==================== EXHAUSTIVE / PARALLEL VERIFICATION ====================
+EXHAUSTIVE_LIMIT = 256      # groups up to this order are checked exhaustively
+SAMPLE_BUDGET = 100000      # random checks per axiom for larger groups
+
+VerificationReport = namedtuple('VerificationReport', ['mode', 'order', 'checks', 'seconds'])
+
+def _element_key(e):
+    """Hashable key of a group element (elements may define __eq__ without __hash__)"""
+    try:
+        hash(e)
+        return e
+    except TypeError:
+        return repr(e)
+
+def _cayley_table(elements, index, op, include=None):
+    """Table T[i, j] = index of op(elements[i], elements[j])"""
+    n = len(elements)
+    table = np.empty((n, n), dtype=np.int64)
+    for i, a in enumerate(elements):
+        for j, b in enumerate(elements):
+            result = op(a, b)
+            k = index.get(_element_key(result))
+            assert k is not None and (include is None or include(result)), \
+                f"Closure failed: {a} op {b} = {result} is not in G"
+            table[i, j] = k
+    return table
+
+def _triples_hold(n, check, budget=32 << 20):
+    """Run check(i) on row blocks i whose two int64 temporaries fit in budget bytes"""
+    block = max(1, budget // (2 * 8 * n * n))
+    for start in range(0, n, block):
+        i = np.arange(start, min(start + block, n))
+        if not check(i):
+            return False
+    return True
+
+def _exhaustive_group(g, commutative):
+    elements = list(g)
+    n = len(elements)
+    index = {_element_key(e): i for i, e in enumerate(elements)}
+    print(f"Building {n}x{n} Cayley table...")
+    table = _cayley_table(elements, index, g.operation, g.include)
+    print("✓ Closure passed")
+    
+    # (a op b) op c == a op (b op c) for all triples, one block of a at a time
+    assoc = _triples_hold(n, lambda i: np.array_equal(table[table[i]], table[i][:, table]))
+    assert assoc, "Associativity failed"
+    print("✓ Associativity passed")
+    
+    e = index.get(_element_key(g.identity))
+    assert e is not None, f"Identity {g.identity} is not in G"
+    everything = np.arange(n)
+    assert np.array_equal(table[e], everything) and np.array_equal(table[:, e], everything), \
+        "Identity element failed"
+    print("✓ Identity element passed")
+    
+    inverses = np.array([index.get(_element_key(g.inverse(a)), -1) for a in elements])
+    assert np.all(inverses >= 0), "Inverse not in G"
+    assert np.all(table[everything, inverses] == e) and np.all(table[inverses, everything] == e), \
+        "Inverse element failed"
+    print("✓ Inverse element passed")
+    
+    if commutative:
+        assert np.array_equal(table, table.T), "Commutativity failed"
+        print("✓ Commutativity passed")
+    return n ** 3 + n * n
+
+def _sampled_group_checks(g, count, seed, commutative):
+    """One worker's share of the sampled axiom checks"""
+    random.seed(seed)
+    identity = g.identity
+    for _ in range(count):
+        a, b, c = g.random_generate(), g.random_generate(), g.random_generate()
+        ab = g.operation(a, b)
+        assert g.include(ab), f"Closure failed: {a} op {b} = {ab} is not in G"
+        assert g.operation(ab, c) == g.operation(a, g.operation(b, c)), \
+            f"Associativity failed: ({a} op {b}) op {c} != {a} op ({b} op {c})"
+        assert g.operation(a, identity) == a and g.operation(identity, a) == a, \
+            f"Identity failed for {a}"
+        a_inverse = g.inverse(a)
+        assert g.include(a_inverse), f"Inverse {a_inverse} for {a} is not in G"
+        assert g.operation(a, a_inverse) == identity and g.operation(a_inverse, a) == identity, \
+            f"Inverse failed for {a}"
+        if commutative:
+            assert ab == g.operation(b, a), f"Commutativity failed: {a} op {b} != {b} op {a}"
+    return count
+
+def _sampled_distributivity(f, count, seed):
+    random.seed(seed)
+    for _ in range(count):
+        a, b, c = f.random_element(), f.random_element(), f.random_element()
+        add = f.add_group.operation
+        assert _field_mul(f, a, add(b, c)) == add(_field_mul(f, a, b), _field_mul(f, a, c)), \
+            f"Left distributivity failed: {a} * ({b} + {c})"
+        assert _field_mul(f, add(a, b), c) == add(_field_mul(f, a, c), _field_mul(f, b, c)), \
+            f"Right distributivity failed: ({a} + {b}) * {c}"
+    return count
+
+def _run_sampled(worker, target, samples, workers, *args):
+    """Split samples across a process pool (in-process if target cannot be pickled)"""
+    workers = workers or os.cpu_count()
+    chunks = min(samples, 4 * workers) or 1
+    counts = [samples // chunks + (i < samples % chunks) for i in range(chunks)]
+    seeds = [random.randrange(1 << 62) for _ in counts]
+    try:
+        pickle.dumps(target)
+    except Exception:
+        workers = 1
+    if workers == 1:
+        return sum(worker(target, c, s, *args) for c, s in zip(counts, seeds))
+    with ProcessPoolExecutor(workers) as pool:
+        return sum(pool.map(worker, repeat(target), counts, seeds, *(repeat(a) for a in args)))
+
+def _group_order(g):
+    try:
+        return g.order
+    except (AttributeError, NotImplementedError, ValueError):
+        return None
+
+def verify_group(g, commutative=False, exhaustive_limit=EXHAUSTIVE_LIMIT,
+                 samples=SAMPLE_BUDGET, workers=None):
+    """Check the group axioms, exhaustively for small orders, sampled in parallel otherwise"""
+    start = time.perf_counter()
+    order = _group_order(g)
+    if order is not None and order <= exhaustive_limit:
+        mode = 'exhaustive'
+        checks = _exhaustive_group(g, commutative)
+    else:
+        mode = 'sampled'
+        print(f"Sampling {samples} element triples...")
+        checks = _run_sampled(_sampled_group_checks, g, samples, workers, commutative)
+        print("✓ Closure, associativity, identity, inverse" + (", commutativity" if commutative else "") + " passed")
+    seconds = time.perf_counter() - start
+    print(f"{mode}: {checks} checks in {seconds:.3f} s ({checks / max(seconds, 1e-9):,.0f} checks/s)")
+    return VerificationReport(mode, order, checks, seconds)
+
+def verify_field(f, exhaustive_limit=EXHAUSTIVE_LIMIT, samples=SAMPLE_BUDGET, workers=None):
+    """Check all field axioms with verify_group and a distributivity check over all or sampled triples"""
+    print("\n1. Verifying Additive Group:")
+    reports = [verify_group(f.add_group, True, exhaustive_limit, samples, workers)]
+    print("\n2. Verifying Multiplicative Group:")
+    reports.append(verify_group(f.mul_group, True, exhaustive_limit, samples, workers))
+    print("\n3. Verifying Distributivity:")
+    start = time.perf_counter()
+    order = _group_order(f.add_group)
+    if order is not None and order <= exhaustive_limit:
+        mode = 'exhaustive'
+        elements = list(f.add_group)
+        n = len(elements)
+        index = {_element_key(e): i for i, e in enumerate(elements)}
+        add = _cayley_table(elements, index, f.add_group.operation)
+        mul = _cayley_table(elements, index, lambda a, b: _field_mul(f, a, b))
+        left = _triples_hold(n, lambda i: np.array_equal(
+            mul[i][:, add], add[mul[i][:, :, None], mul[i][:, None, :]]))
+        assert left, "Left distributivity failed"
+        right = _triples_hold(n, lambda i: np.array_equal(
+            mul[add[i]], add[mul[i][:, None, :], mul[None, :, :]]))
+        assert right, "Right distributivity failed"
+        checks = 2 * n ** 3
+    else:
+        mode = 'sampled'
+        checks = _run_sampled(_sampled_distributivity, f, samples, workers)
+    seconds = time.perf_counter() - start
+    print("✓ Distributivity passed")
+    print(f"{mode}: {checks} checks in {seconds:.3f} s ({checks / max(seconds, 1e-9):,.0f} checks/s)")
+    reports.append(VerificationReport(mode, order, checks, seconds))
+    return reports
+
 # ==================== DEMONSTRATION AND TESTING ====================
 def demonstrate_basic_operations(prime=7):
     """Demonstrate basic finite field operations"""
@@ -437,8 +2614,8 @@ def demonstrate_basic_operations(prime=7):
     print("Basic Arithmetic:")
     print(f"a + b = {a} + {b} = {gf.add_group.operation(a, b)}")
     print(f"a - b = {a} - {b} = {gf.add_group.operation(a, gf.add_group.inverse(b))}")
-    print(f"a * b = {a} * {b} = {gf.mul_group.operation(a, b)}")
-    print(f"a / b = {a} / {b} = {gf.mul_group.operation(a, gf.mul_group.inverse(b))}")
+    print(f"a * b = {a} * {b} = {_field_mul(gf, a, b)}")
+    print(f"a / b = {a} / {b} = {_field_mul(gf, a, gf.mul_group.inverse(b))}")
     print()
     
     # Test inverses
@@ -497,6 +2674,56 @@ def demonstrate_operator_overloading(prime=7):
     print(f"a*b + a*c   = {right}")
     print(f"Distributive property holds: {left == right}")
 
+def demonstrate_extension_field():
+    """Demonstrate GF(2^8) arithmetic and byte-buffer operations"""
+    print(f"\n{'='*60}")
+    print("EXTENSION FIELD DEMONSTRATION - GF(2^8)")
+    print(f"{'='*60}")
+    
+    gf = ExtensionField(2, 8)
+    a = gf.element(0x53)
+    b = gf.element(0xca)
+    print(f"modulus = {gf.modulus:#x}, generator = {gf.tables.generator}")
+    print(f"{a} + {b} = {gf.add_group.operation(a, b)}")
+    print(f"{a} * {b} = {gf.mul_group.operation(a, b)}")
+    print(f"1 / {a} = {gf.mul_group.inverse(a)}")
+    
+    # parity = 3 * data, accumulated into a buffer
+    data = bytes(random.randrange(256) for _ in range(1 << 16))
+    parity = bytearray(len(data))
+    start = time.perf_counter()
+    gf.buffer_addmul(parity, 3, data)
+    seconds = time.perf_counter() - start
+    check = gf.buffer_mul(gf.mul_group.inverse(gf.element(3)), parity)
+    print(f"multiply-accumulate of {len(data)} bytes: {len(data) / max(seconds, 1e-9) / 1e6:.0f} MB/s, "
+          f"round trip ok: {bytes(check) == data}")
+
+def demonstrate_elliptic_curve():
+    """Check the group axioms on a small curve and time scalar multiplication on secp256k1"""
+    print(f"\n{'='*60}")
+    print("ELLIPTIC CURVE DEMONSTRATION")
+    print(f"{'='*60}")
+    
+    small = EllipticCurve(97, 2, 3)
+    print(f"{small}: {small.order} points")
+    check_commutative_group(small)
+    
+    p = 2**256 - 2**32 - 977
+    n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    curve = EllipticCurve(p, 0, 7, order=n)
+    g = curve.point(0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+                    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8)
+    print(f"secp256k1: n*G is infinity: {curve.multiply(g, n) == curve.identity}")
+    scalars = [random.randrange(n) for _ in range(200)]
+    for label in ("wNAF", "comb"):
+        if label == "comb":
+            curve.precompute(g, window=8)
+        start = time.perf_counter()
+        for k in scalars:
+            curve.multiply(g, k)
+        seconds = time.perf_counter() - start
+        print(f"{label}: {len(scalars) / seconds:,.0f} scalar multiplications/s")
+
 def run_comprehensive_tests():
     """Run comprehensive tests on multiple prime fields"""
     print("FINITE FIELD IMPLEMENTATION TEST")
@@ -537,6 +2764,13 @@ if __name__ == "__main__":
     # Run comprehensive tests
     run_comprehensive_tests()
     
+    # Exhaustive check of a field too large for the per-element tests above
+    print("EXHAUSTIVE VERIFICATION - GF(251)")
+    verify_field(FiniteField(251))
+    demonstrate_extension_field()
+    demonstrate_elliptic_curve()
+    print()
+    
     # Final verification
     print("FINAL VERIFICATION COMPLETED SUCCESSFULLY!")
     print("All finite field properties have been verified:")